@@ -1,19 +1,288 @@
 import requests
+import urllib3
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import (
+    JavascriptException,
+    SessionNotCreatedException,
+    TimeoutException,
+    WebDriverException,
+)
+from bs4 import BeautifulSoup, FeatureNotFound, Tag, UnicodeDammit
 import time
 import json
+import os
+import gzip
+import base64
+import hashlib
+import re
+import shutil
+import subprocess
+import queue
+import signal
+import random
+import calendar
+import datetime
+import functools
+import argparse
+import threading
+import collections
+import multiprocessing
 from webdriver_manager.chrome import ChromeDriverManager
-from urllib.parse import urljoin
+from urllib.parse import quote, urljoin, urlsplit
+from requests.adapters import HTTPAdapter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: shared caches go unlocked
+
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Runtime switches set from the command line and handed to worker processes
+RUN_CONFIG = {
+    "replay": False,
+    "html_cache": True,
+    "incremental": False,
+    "previous_output": "complete_exam_data.json",
+    "parser": "lxml",
+    "partial_parse": True,
+    "browser_extract": False,
+    "browser_extract_markup": False,
+    "apis": True,
+    "structured_data": True,
+}
+
+# Once chromedriver is gone Selenium raises the underlying urllib3 error or a
+# socket reset instead of a WebDriverException; any of these means a dead
+# browser. Other OSErrors (disk full, a missing cache file) are our own.
+BROWSER_ERRORS = (WebDriverException, urllib3.exceptions.HTTPError, ConnectionError)
+
+
+# ---------------- RESOURCE BLOCKING ----------------
+# The extractors only read text and iframe src attributes, so Chrome is told
+# (via CDP Network.setBlockedURLs) not to fetch heavy assets or trackers.
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*.avif*"],
+    "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media": ["*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*"],
+    "stylesheet": ["*.css*"],
+}
+BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+BLOCKED_DOMAINS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "adservice.google.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "amazon-adsystem.com",
+    "facebook.net",
+    "taboola.com",
+    "outbrain.com",
+    "hotjar.com",
+    "clarity.ms",
+    "scorecardresearch.com",
+)
+
+NETWORK_STATS = {
+    "requests": 0,
+    "bytes_downloaded": 0,
+    "blocked_requests": 0,
+    "blocked_by_type": {},
+}
+
+
+def blocked_url_patterns(block_types=BLOCKED_RESOURCE_TYPES, block_domains=BLOCKED_DOMAINS):
+    patterns = []
+
+    for resource_type in block_types:
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+
+    for domain in block_domains:
+        patterns.append(f"*{domain}/*")
+
+    return patterns
+
+
+def record_network_stats(driver):
+    # Draining the performance log every page also keeps chromedriver's
+    # buffer from growing for the whole run
+    try:
+        entries = driver.get_log("performance")
+    except BROWSER_ERRORS:
+        return
+
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        if NETWORK_CAPTURE is not None:
+            NETWORK_CAPTURE.append(message)
+
+        method = message.get("method")
+        params = message.get("params", {})
+
+        if method == "Network.requestWillBeSent":
+            NETWORK_STATS["requests"] += 1
+        elif method == "Network.loadingFinished":
+            NETWORK_STATS["bytes_downloaded"] += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            resource_type = params.get("type", "Other")
+            NETWORK_STATS["blocked_requests"] += 1
+            NETWORK_STATS["blocked_by_type"][resource_type] = (
+                NETWORK_STATS["blocked_by_type"].get(resource_type, 0) + 1
+            )
+
+
+def merge_counters(target, source):
+    for key, value in source.items():
+        if isinstance(value, dict):
+            merge_counters(target.setdefault(key, {}), value)
+        else:
+            target[key] = target.get(key, 0) + value
+
+
+def print_network_stats():
+    # Chrome never fetches a blocked URL, so its size is unknown; the
+    # saving shows up as fewer bytes downloaded per page
+    print(
+        f"🌐 Browser requests: {NETWORK_STATS['requests']}, "
+        f"downloaded: {NETWORK_STATS['bytes_downloaded'] / 1024 / 1024:.1f} MB, "
+        f"blocked: {NETWORK_STATS['blocked_requests']} {NETWORK_STATS['blocked_by_type']}"
+    )
+
+
+# ---------------- CHROMEDRIVER CACHE ----------------
+# ChromeDriverManager resolves versions over the network on every call. The
+# browser/driver pair is looked up once, written to a small manifest and
+# reused until the browser version changes.
+CACHE_DIR = ".scraper_cache"
+DRIVER_MANIFEST = os.path.join(CACHE_DIR, "chromedriver.json")
+
+BROWSER_CANDIDATES = (
+    "/usr/bin/chromium",
+    "/usr/bin/chromium-browser",
+    "/usr/bin/google-chrome",
+    "chromium",
+    "chromium-browser",
+    "google-chrome",
+    "google-chrome-stable",
+)
+CHROMEDRIVER_CANDIDATES = (
+    "/usr/bin/chromedriver",
+    "/usr/lib/chromium/chromedriver",
+    "/usr/lib/chromium-browser/chromedriver",
+    "chromedriver",
+)
+
+VERSION_RE = re.compile(r"(\d+)\.\d+\.\d+\.\d+")
+
+
+def load_json(path, default=None):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json_atomic(path, data, **dump_kwargs):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, **dump_kwargs)
+    os.replace(tmp_path, path)
+
+
+# Caches that several workers write to are merged under an exclusive lock on
+# a sidecar file; without it two workers can both read the old file and the
+# second write drops the first one's entries
+def update_json(path, entries, prune=None):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(f"{path}.lock", "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)  # released when the file closes
+
+        data = load_json(path, {})
+        if prune is not None:
+            data = prune(data)
+        data.update(entries)
+        write_json_atomic(path, data)
+
+    return data
+
+
+def find_executable(candidates):
+    for candidate in candidates:
+        path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if path and os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+    return None
+
+
+def executable_version(path):
+    try:
+        output = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    match = VERSION_RE.search(output)
+    return match.group(0) if match else None
+
+
+def resolve_chrome_binaries(refresh=False):
+    browser = find_executable(BROWSER_CANDIDATES)
+    browser_version = executable_version(browser) if browser else None
+
+    manifest = None if refresh else load_json(DRIVER_MANIFEST)
+    if (
+        manifest
+        and manifest.get("browser") == browser
+        and manifest.get("browser_version") == browser_version
+        and os.path.isfile(manifest.get("chromedriver") or "")
+    ):
+        return browser, manifest["chromedriver"]
+
+    # A local chromedriver is only usable if its major version matches
+    chromedriver = find_executable(CHROMEDRIVER_CANDIDATES)
+    if chromedriver and browser_version:
+        driver_version = executable_version(chromedriver)
+        if not driver_version or driver_version.split(".")[0] != browser_version.split(".")[0]:
+            chromedriver = None
+
+    if chromedriver is None:
+        chromedriver = ChromeDriverManager().install()
+
+    write_json_atomic(DRIVER_MANIFEST, {
+        "browser": browser,
+        "browser_version": browser_version,
+        "chromedriver": chromedriver,
+    }, indent=4)
+
+    return browser, chromedriver
 
 
 # ---------------- DRIVER SETUP ----------------
-def create_driver():
+def create_driver(block_types=BLOCKED_RESOURCE_TYPES, block_domains=BLOCKED_DOMAINS):
     options = Options()
 
     options.add_argument("--headless=new")
@@ -22,1597 +291,1885 @@ def create_driver():
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
 
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
+    options.add_argument(f"user-agent={USER_AGENT}")
+
+    # Network events for record_network_stats()
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
-    # Remove this line if running on Windows
-    options.binary_location = "/usr/bin/chromium"
+    browser, chromedriver = resolve_chrome_binaries()
+    if browser:
+        options.binary_location = browser
 
-    service = Service(ChromeDriverManager().install())
+    try:
+        driver = webdriver.Chrome(service=Service(chromedriver), options=options)
+    except SessionNotCreatedException:
+        # Cached driver no longer fits the installed browser, resolve again
+        browser, chromedriver = resolve_chrome_binaries(refresh=True)
+        driver = webdriver.Chrome(service=Service(chromedriver), options=options)
+
+    patterns = blocked_url_patterns(block_types, block_domains)
+    if patterns:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
 
-    driver = webdriver.Chrome(service=service, options=options)
     return driver
 
 
+# ---------------- RATE LIMITER ----------------
+# One token bucket shared by every fetch in every worker process (plain HTTP
+# and driver.get alike), plus a cap on requests in flight. Both grow
+# additively while responses come back fast and clean, and are cut in half
+# on 403/429/503, errors, slow responses or challenge pages.
+RATE_LIMIT_INITIAL = 2.0
+RATE_LIMIT_MIN = 0.2
+RATE_LIMIT_MAX = 20.0
+RATE_INCREASE = 0.1
+CONCURRENCY_INITIAL = 2
+CONCURRENCY_MAX = 16
+BACKOFF_FACTOR = 0.5
+BACKOFF_COOLDOWN = 2.0
+SLOW_RESPONSE = 8.0
+
+THROTTLE_STATUSES = (403, 429, 503)
+CHALLENGE_MARKERS = (
+    "captcha",
+    "access denied",
+    "are you a robot",
+    "unusual traffic",
+    "just a moment",
+    "attention required",
+)
+
+TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+CHALLENGE_SCAN_BYTES = 32 * 1024
+
+RATE_LIMITER = None
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate=RATE_LIMIT_INITIAL,
+        max_rate=RATE_LIMIT_MAX,
+        concurrency=CONCURRENCY_INITIAL,
+        max_concurrency=CONCURRENCY_MAX,
+    ):
+        # Shared memory so forked workers all draw from the same bucket
+        self.lock = multiprocessing.Lock()
+        self.rate = multiprocessing.Value("d", rate, lock=False)
+        self.max_rate = max_rate
+        self.tokens = multiprocessing.Value("d", 1.0, lock=False)
+        self.refilled_at = multiprocessing.Value("d", time.time(), lock=False)
+        self.concurrency = multiprocessing.Value("d", concurrency, lock=False)
+        self.max_concurrency = max_concurrency
+        self.in_flight = multiprocessing.Value("i", 0, lock=False)
+        self.backed_off_at = multiprocessing.Value("d", 0.0, lock=False)
+        self.backoffs = multiprocessing.Value("i", 0, lock=False)
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.time()
+                rate = self.rate.value
+                burst = max(1.0, rate)
+
+                elapsed = now - self.refilled_at.value
+                self.tokens.value = min(burst, self.tokens.value + elapsed * rate)
+                self.refilled_at.value = now
+
+                if self.tokens.value >= 1 and self.in_flight.value < int(self.concurrency.value):
+                    self.tokens.value -= 1
+                    self.in_flight.value += 1
+                    return
+
+                if self.tokens.value < 1:
+                    wait = (1 - self.tokens.value) / rate
+                else:
+                    wait = 0.05
+
+            time.sleep(min(max(wait, 0.01), 1.0))
+
+    def release(self, latency, healthy=True):
+        with self.lock:
+            self.in_flight.value -= 1
+
+            if healthy and latency < SLOW_RESPONSE:
+                self.rate.value = min(self.max_rate, self.rate.value + RATE_INCREASE)
+                # +1 slot per window's worth of healthy responses
+                self.concurrency.value = min(
+                    self.max_concurrency,
+                    self.concurrency.value + 1 / self.concurrency.value,
+                )
+                return
+
+            # Responses already in flight during a slowdown all come back bad,
+            # only cut once per cooldown
+            now = time.time()
+            if now - self.backed_off_at.value < BACKOFF_COOLDOWN:
+                return
+
+            self.rate.value = max(RATE_LIMIT_MIN, self.rate.value * BACKOFF_FACTOR)
+            self.concurrency.value = max(1.0, self.concurrency.value * BACKOFF_FACTOR)
+            self.tokens.value = 0.0
+            self.backed_off_at.value = now
+            self.backoffs.value += 1
+
+    def describe(self):
+        return (
+            f"rate {self.rate.value:.1f}/s, concurrency {int(self.concurrency.value)}, "
+            f"{self.backoffs.value} backoffs"
+        )
+
+
+def install_rate_limiter(limiter):
+    global RATE_LIMITER
+    RATE_LIMITER = limiter
+
+
+def acquire_slot():
+    if RATE_LIMITER is not None:
+        RATE_LIMITER.acquire()
+
+
+def release_slot(latency, healthy=True):
+    if RATE_LIMITER is not None:
+        RATE_LIMITER.release(latency, healthy)
+
+
+def looks_like_challenge(title):
+    title = (title or "").lower()
+    return any(marker in title for marker in CHALLENGE_MARKERS)
+
+
+# ---------------- MANAGED DRIVER ----------------
+# One Chrome serving thousands of navigations slowly bloats and eventually
+# dies. ManagedDriver proxies the WebDriver API, keeps an eye on pages
+# served, renderer memory and navigation latency, and swaps in a fresh
+# browser once a threshold is crossed. A watchdog kills a navigation that
+# hangs past the page load timeout instead of blocking forever.
+MAX_PAGES_PER_DRIVER = 200
+MAX_RENDERER_RSS_MB = 1500
+MAX_NAV_LATENCY = 20
+NAV_TIMEOUT = 45
+WATCHDOG_GRACE = 15
+LATENCY_WINDOW = 20
+RSS_CHECK_EVERY = 10
+
+
+def process_tree(root_pid):
+    children = {}
+
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                stat = f.read()
+        except OSError:
+            continue
+
+        # Fields after the ")" closing the command name: state, ppid, ...
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    pids = []
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+
+    return pids
+
+
+def renderer_rss_mb(root_pid):
+    if not os.path.isdir("/proc"):
+        return None
+
+    total_kb = 0
+    for pid in process_tree(root_pid):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                if b"--type=renderer" not in f.read():
+                    continue
+            with open(f"/proc/{pid}/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+
+    return total_kb / 1024
+
+
+class ManagedDriver:
+    def __init__(
+        self,
+        max_pages=MAX_PAGES_PER_DRIVER,
+        max_rss_mb=MAX_RENDERER_RSS_MB,
+        max_latency=MAX_NAV_LATENCY,
+        nav_timeout=NAV_TIMEOUT,
+        **driver_kwargs
+    ):
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.max_latency = max_latency
+        self.nav_timeout = nav_timeout
+        self.driver_kwargs = driver_kwargs
+
+        self.driver = None
+        self.restarts = 0
+        self.start()
+
+    def __getattr__(self, name):
+        # Everything not managed here goes straight to the real driver
+        return getattr(self.driver, name)
+
+    def start(self):
+        self.driver = create_driver(**self.driver_kwargs)
+        self.driver.set_page_load_timeout(self.nav_timeout)
+
+        self.pages_served = 0
+        self.latencies = collections.deque(maxlen=LATENCY_WINDOW)
+        self.hung = False
+
+    def root_pid(self):
+        process = getattr(self.driver.service, "process", None)
+        return process.pid if process else None
+
+    def kill_browser(self):
+        self.hung = True
+        pid = self.root_pid()
+        if pid is None:
+            return
+
+        pids = process_tree(pid) if os.path.isdir("/proc") else [pid]
+        for child in reversed(pids):
+            try:
+                os.kill(child, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+    def quit(self):
+        if self.driver is None:
+            return
+
+        record_network_stats(self.driver)
+        try:
+            self.driver.quit()
+        except BROWSER_ERRORS:
+            self.kill_browser()
+        self.driver = None
+
+    def restart(self, reason):
+        print(f"♻️ Restarting Chrome after {self.pages_served} pages: {reason}")
+        self.quit()
+        self.start()
+        self.restarts += 1
+
+    def recycle_reason(self):
+        if self.pages_served >= self.max_pages:
+            return f"served {self.pages_served} pages"
+
+        if len(self.latencies) == self.latencies.maxlen:
+            average = sum(self.latencies) / len(self.latencies)
+            if average > self.max_latency:
+                return f"average navigation took {average:.1f}s"
+
+        if self.pages_served and self.pages_served % RSS_CHECK_EVERY == 0:
+            pid = self.root_pid()
+            rss = renderer_rss_mb(pid) if pid else None
+            if rss is not None and rss > self.max_rss_mb:
+                return f"renderers using {rss:.0f} MB"
+
+        return None
+
+    def get(self, url):
+        reason = self.recycle_reason()
+        if reason:
+            self.restart(reason)
+
+        watchdog = threading.Timer(self.nav_timeout + WATCHDOG_GRACE, self.kill_browser)
+        watchdog.daemon = True
+
+        acquire_slot()
+        healthy = False
+        started = time.monotonic()
+        watchdog.start()
+        try:
+            self.driver.get(url)
+            healthy = not looks_like_challenge(self.driver.title)
+        except BROWSER_ERRORS as e:
+            # The watchdog's kill surfaces as a urllib3 error, not a timeout
+            if self.hung:
+                self.restart("navigation hung")
+                raise TimeoutException(f"Navigation to {url} hung, Chrome was killed")
+            if not isinstance(e, TimeoutException) and not self.is_responsive():
+                self.restart(f"browser crashed ({e.__class__.__name__})")
+            raise
+        finally:
+            watchdog.cancel()
+            release_slot(time.monotonic() - started, healthy)
+
+        self.latencies.append(time.monotonic() - started)
+        self.pages_served += 1
+
+    def is_responsive(self):
+        try:
+            self.driver.execute_script("return 1;")
+            return True
+        except BROWSER_ERRORS:
+            return False
+
+
+# ---------------- PAGE READINESS ----------------
+# A page is ready once the document has loaded, the containers we parse are
+# present and the DOM has stopped mutating for QUIET_WINDOW seconds. A page
+# that stays idle for SETTLED_WINDOW without them is taken as-is, and every
+# page type gets a hard cap instead of a flat sleep.
+QUIET_WINDOW = 0.5
+SETTLED_WINDOW = 2.0
+READY_POLL_INTERVAL = 0.1
+
+LISTING_SELECTORS = (".uilp_exam_card",)
+DETAIL_SELECTORS = ("h1", ".sectionalWrapperClass")
+
+DEFAULT_PAGE_TIMEOUT = 12
+LISTING_TIMEOUT = 15
+
+READY_SCRIPT = """
+var selectors = arguments[0];
+if (window.__lastMutationAt === undefined) {
+    window.__lastMutationAt = Date.now();
+    new MutationObserver(function () {
+        window.__lastMutationAt = Date.now();
+    }).observe(document.documentElement, {
+        childList: true, subtree: true, characterData: true
+    });
+}
+return {
+    complete: document.readyState === "complete",
+    missing: selectors.filter(function (s) { return !document.querySelector(s); }),
+    quiet_ms: Date.now() - window.__lastMutationAt
+};
+"""
+
+
+def page_timeout(page_type):
+    if page_type in PAGE_TYPES:
+        return PAGE_TYPES[page_type]["timeout"]
+    return DEFAULT_PAGE_TIMEOUT
+
+
+def wait_until_ready(
+    driver,
+    selectors=(),
+    timeout=DEFAULT_PAGE_TIMEOUT,
+    quiet=QUIET_WINDOW,
+    settled=SETTLED_WINDOW,
+):
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            state = driver.execute_script(READY_SCRIPT, list(selectors))
+        except JavascriptException:
+            # Document swapped out under us mid-navigation, just poll again
+            state = None
+
+        if state and state["complete"]:
+            if not state["missing"] and state["quiet_ms"] >= quiet * 1000:
+                return True
+
+            # Loaded and idle for a while, the missing containers aren't coming
+            if state["quiet_ms"] >= settled * 1000:
+                return False
+
+        if time.monotonic() >= deadline:
+            return False
+
+        time.sleep(READY_POLL_INTERVAL)
+
+
 # ---------------- SCROLL FUNCTION ----------------
-def scroll_to_bottom(driver, scroll_times=3, pause=2):
+def scroll_to_bottom(driver, scroll_times=3, timeout=DEFAULT_PAGE_TIMEOUT, selectors=()):
+    deadline = time.monotonic() + timeout
+    last_height = None
+
     for _ in range(scroll_times):
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(pause)
+        height = driver.execute_script(
+            "window.scrollTo(0, document.body.scrollHeight);"
+            "return document.body.scrollHeight;"
+        )
+
+        # Nothing new was lazy-loaded by the previous scroll
+        if height == last_height:
+            break
+        last_height = height
+
+        wait_until_ready(driver, selectors, max(0, deadline - time.monotonic()))
 
 BASE = "https://www.shiksha.com"
 LISTING_URL = "https://www.shiksha.com/mba/exams-pc-101"
 
 
-# ---------------- LISTING SCRAPER ----------------
-def scrape_listing_page(driver,page_no=1):
-    all_exams = []
+# ---------------- HTML PARSER ----------------
+# lxml builds the same tree several times faster than the pure Python
+# html.parser, which matters once pages are fetched in parallel.
+# html.parser stays as the fallback when lxml isn't installed.
+HTML_PARSERS = ("lxml", "html.parser")
+FALLBACK_PARSER = "html.parser"
 
-    if page_no == 1:
-        url = LISTING_URL
-    else:
-        url = f"{LISTING_URL}?pageNo={page_no}"
+PARSER_AVAILABLE = {}
 
-    driver.get(url)
 
-    WebDriverWait(driver, 15).until(
-        EC.presence_of_element_located((By.CLASS_NAME, "uilp_exam_card"))
-    )
+def parser_available(name):
+    if name not in PARSER_AVAILABLE:
+        try:
+            BeautifulSoup("", name)
+            PARSER_AVAILABLE[name] = True
+        except FeatureNotFound:
+            PARSER_AVAILABLE[name] = False
+    return PARSER_AVAILABLE[name]
 
-    scroll_to_bottom(driver)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+def html_parser():
+    name = RUN_CONFIG["parser"]
+    if not parser_available(name):
+        print(f"⚠️ HTML parser {name!r} is not installed, using {FALLBACK_PARSER}")
+        RUN_CONFIG["parser"] = name = FALLBACK_PARSER
+    return name
 
-    cards = soup.select(".uilp_exam_card")
 
-    for card in cards:
-        result = {}
+def make_soup(markup, parser=None):
+    return BeautifulSoup(markup, parser or html_parser())
 
-        exam_title = card.select_one(".exam_title")
 
-        if exam_title:
-            result["exam_short_name"] = exam_title.get_text(strip=True)
+# Exam pages are mostly header, footer, menus and scripts. The extractors,
+# the not-found check and the incremental fingerprint only ever read the
+# regions below, so lxml cuts them out first and BeautifulSoup only builds
+# a tree for those. Every match is kept, in document order, so "first h1"
+# or "first Updated span" is the same element as in the full page.
+def has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
 
-            relative_link = exam_title.get("href")
-            result["exam_relative_url"] = relative_link
-            result["exam_full_url"] = urljoin(BASE, relative_link)
 
-            # Base URL for further pattern/syllabus scraping
-            result["base_url"] = urljoin(BASE, relative_link).rstrip("/")
-        else:
-            continue
+PAGE_REGIONS_XPATH = " | ".join([
+    "//title",
+    "//h1",
+    "//span[contains(., 'Updated')]",
+    f"//div[{has_class('ppBox')}]",
+    f"//div[{has_class('sectionalWrapperClass')}]",
+    f"//div[{has_class('poll-container')}]",
+    # faq_entry walks from the question to its parent's next sibling
+    f"//strong[{has_class('flx-box')}]/../..",
+    f"//*[{has_class('flx-box')}]",
+    f"//*[{has_class('facb5f')}]",
+    # JSON-LD, for structured_page_data()
+    "//script[@type='application/ld+json']",
+])
 
-        # Full Exam Name
-        full_name = card.select_one(".exam_flnm")
-        result["exam_full_name"] = full_name.get_text(strip=True) if full_name else None
 
-        # Important Dates
-        result["important_dates"] = []
+def slice_page_regions(markup):
+    if isinstance(markup, bytes):
+        markup = UnicodeDammit(markup, is_html=True).unicode_markup
 
-        rows = card.select(".exam_impdates table tr")
+    root = lxml.html.document_fromstring(markup)
+    regions = []
+    last = None
 
-        for row in rows:
-            date_col = row.select_one(".fix-tdwidth p")
-            event_col = row.select_one(".fix-textlength p")
+    # The union comes back in document order, so a region nested in the
+    # previous one is already part of it
+    for node in root.xpath(PAGE_REGIONS_XPATH):
+        if last is not None and any(parent is last for parent in node.iterancestors()):
+            continue
+        regions.append(lxml.html.tostring(node, encoding="unicode", with_tail=False))
+        last = node
 
-            if date_col and event_col:
-                result["important_dates"].append({
-                    "date": " ".join(date_col.get_text().split()),
-                    "event": event_col.get_text(strip=True)
-                })
+    return "<html><body>" + "".join(regions) + "</body></html>"
 
-        all_exams.append(result)
 
-    return all_exams
+def partial_parse_enabled():
+    return RUN_CONFIG["partial_parse"] and lxml is not None and html_parser() == "lxml"
 
 
+def make_page_soup(markup, partial=False):
+    if partial and partial_parse_enabled():
+        markup = slice_page_regions(markup)
 
-# 🔥 Scrape Multiple Pages
-# all_exams = []
+    soup = make_soup(markup)
+    # What the tree was built from, so it can be rebuilt in another process
+    soup.page_markup = markup
+    return soup
 
-# for page in range(1, 5):   # 1 se 4 tak
-#     print(f"Scraping page {page}")
-#     data = scrape_listing_page(driver, page)
-#     all_exams.extend(data)
 
-# print("Total exams scraped:", len(all_exams))
+# The fetch side of the parse pipeline only has to know whether a page is the
+# not-found template and has the containers we read. An lxml tree answers
+# that for a fraction of what the BeautifulSoup one costs, and the raw markup
+# goes to the parse pool, which builds the real tree once.
+def selector_xpath(selector):
+    # Only the bare tag and .class selectors the page types use
+    if selector.startswith("."):
+        return f"//*[{has_class(selector[1:])}]"
+    return f"//{selector}"
 
-def extract_cat_exam_data(driver, URLS):
-    driver.get(URLS["overviews"])
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+class PageMarkup:
+    def __init__(self, markup):
+        self.page_markup = markup
+        self.root = None
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+    def tree(self):
+        if self.root is None:
+            self.root = lxml.html.document_fromstring(self.page_markup)
+        return self.root
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    def first_text(self, xpath):
+        nodes = self.tree().xpath(xpath)
+        return nodes[0].text_content().strip() if nodes else None
 
-    data = {}
+    def has(self, selector):
+        return bool(self.tree().xpath(selector_xpath(selector)))
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+def make_fetched_page(markup, partial=False, markup_only=False):
+    if markup_only and lxml is not None:
+        return PageMarkup(markup)
+    return make_page_soup(markup, partial)
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
 
-    data["author"] = author_data
+# ---------------- HTTP FETCH ----------------
+# Most exam pages are server-rendered, so a pooled keep-alive session gets
+# the same HTML in milliseconds. Chrome is only used when the response is
+# missing the containers the extractors read.
+HTTP_TIMEOUT = 10
+HTTP_POOL_SIZE = 10
+REQUIRED_SELECTORS = DETAIL_SELECTORS
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+HTTP_SESSION = None
+HTTP_SESSION_PID = None
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
 
-    data["content_sections"] = all_sections
+def create_http_session(pool_size=HTTP_POOL_SIZE):
+    session = requests.Session()
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Connection": "keep-alive",
+    })
+    return session
 
-    return data
 
-def extract_rich_content(container):
+def get_http_session():
+    global HTTP_SESSION, HTTP_SESSION_PID
 
-    if not container:
-        return {"blocks": []}
+    # A forked worker must not share pooled sockets with its parent
+    if HTTP_SESSION is None or HTTP_SESSION_PID != os.getpid():
+        HTTP_SESSION = create_http_session()
+        HTTP_SESSION_PID = os.getpid()
+    return HTTP_SESSION
 
-    content = {"blocks": []}
 
-    elements = container.find_all(
-        ["h2", "h3", "h4", "p", "ul", "table", "iframe"],
-        recursive=True
-    )
+def has_required_content(soup, selectors=REQUIRED_SELECTORS):
+    if isinstance(soup, PageMarkup):
+        return all(soup.has(sel) for sel in selectors)
+    return all(soup.select_one(sel) is not None for sel in selectors)
 
-    for element in elements:
 
-        # HEADINGS
-        if element.name in ["h2", "h3", "h4"]:
-            text = element.get_text(" ", strip=True)
-            if text:
-                content["blocks"].append({
-                    "type": "heading",
-                    "value": text
-                })
+# ---------------- HTML CACHE ----------------
+# Every page the extractors see is stored gzipped under its sha256, with an
+# append-only index of url -> hash and fetch metadata. --replay runs the
+# extractors against the latest cached copy of each URL without a browser.
+HTML_CACHE_DIR = os.path.join(CACHE_DIR, "html")
+HTML_CACHE_INDEX = os.path.join(HTML_CACHE_DIR, "index.jsonl")
 
-        # PARAGRAPH
-        elif element.name == "p":
-            if element.find_parent("table"):
-                continue
-            text = element.get_text(" ", strip=True)
-            if text:
-                content["blocks"].append({
-                    "type": "paragraph",
-                    "value": text
-                })
-
-        # LIST
-        elif element.name == "ul":
-            items = [
-                li.get_text(" ", strip=True)
-                for li in element.find_all("li", recursive=False)
-            ]
-            if items:
-                content["blocks"].append({
-                    "type": "list",
-                    "value": items
-                })
-
-        # TABLE
-        elif element.name == "table":
-            table_data = []
-            for row in element.find_all("tr"):
-                cols = [
-                    c.get_text(" ", strip=True)
-                    for c in row.find_all(["th", "td"])
-                ]
-                if cols:
-                    table_data.append(cols)
-
-            if table_data:
-                content["blocks"].append({
-                    "type": "table",
-                    "value": table_data
-                })
-
-        # IFRAME
-        elif element.name == "iframe":
-            src = element.get("src") or element.get("data-original")
-            if src:
-                content["blocks"].append({
-                    "type": "iframe",
-                    "value": src
-                })
+HTML_INDEX = None
 
-    return content
 
-def extract_faqs(soup):
+class PageNotCached(Exception):
+    pass
 
-    faqs = []
-    question_blocks = soup.find_all("strong", class_="flx-box")
 
-    for q in question_blocks:
-        question = q.get_text(" ", strip=True).replace("Q:", "").strip()
+def html_object_path(digest):
+    return os.path.join(HTML_CACHE_DIR, "objects", digest[:2], f"{digest}.html.gz")
 
-        answer_wrapper = q.find_parent().find_next_sibling("div")
-        if not answer_wrapper:
-            continue
 
-        answer_div = answer_wrapper.find("div", class_="facb5f")
-        if not answer_div:
-            continue
+def load_html_index():
+    global HTML_INDEX
 
-        answer = answer_div.get_text(" ", strip=True).replace("A:", "").strip()
+    if HTML_INDEX is None:
+        HTML_INDEX = {}
+        try:
+            with open(HTML_CACHE_INDEX, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a killed run
+                    HTML_INDEX[entry["url"]] = entry
+        except OSError:
+            pass
 
-        faqs.append({
-            "question": question,
-            "answer": answer
-        })
+    return HTML_INDEX
 
-    return faqs
 
-def extract_polls(soup):
+def store_page(url, html, source, elapsed=None, status=200, missing=None):
+    if not RUN_CONFIG["html_cache"] or RUN_CONFIG["replay"]:
+        return
 
-    polls = []
-    poll_containers = soup.find_all("div", class_="poll-container")
+    entry = {
+        "url": url,
+        "sha256": None,
+        "source": source,
+        "status": status,
+        "fetched_at": time.time(),
+        "elapsed": round(elapsed, 3) if elapsed is not None else None,
+        "missing": missing,
+    }
 
-    for poll in poll_containers:
-        question_div = poll.find("div", class_="poll-question")
-        options = poll.find_all("div", class_="poll-option")
-        votes_span = poll.find("span", string=lambda x: x and "votes" in x)
+    if html is not None:
+        if isinstance(html, str):
+            html = html.encode("utf-8")
 
-        if not question_div:
-            continue
+        digest = hashlib.sha256(html).hexdigest()
+        path = html_object_path(digest)
 
-        poll_data = {
-            "question": question_div.get_text(strip=True),
-            "options": [
-                opt.get_text(" ", strip=True)
-                for opt in options
-            ],
-            "votes": votes_span.get_text(strip=True) if votes_span else None
-        }
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(html, compresslevel=5))
+            os.replace(tmp_path, path)
 
-        polls.append(poll_data)
+        entry["sha256"] = digest
 
-    return polls
+    os.makedirs(HTML_CACHE_DIR, exist_ok=True)
+    with open(HTML_CACHE_INDEX, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
 
-def extract_result_data(driver, URLS):
-    driver.get(URLS["results"])
+    load_html_index()[url] = entry
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+def cached_page_html(url):
+    entry = load_html_index().get(url)
+    if entry is None:
+        raise PageNotCached(f"{url} is not in the HTML cache")
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    if entry["missing"]:
+        raise PageMissing(entry["missing"])
 
-    data = {}
+    with open(html_object_path(entry["sha256"]), "rb") as f:
+        return gzip.decompress(f.read())
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+def replay_page_soup(url, partial=False, markup_only=False):
+    markup = cached_page_html(url)
+    if markup_only:
+        return PageMarkup(markup)
+    return make_page_soup(markup, partial)
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
 
-    data["author"] = author_data
+# ---------------- MISSING PAGES ----------------
+# Derived URLs that don't exist either 404, redirect to another canonical
+# page or render a generic "not found" template. PageMissing is raised as
+# soon as one of those is seen so the caller can skip parsing.
+NOT_FOUND_MARKERS = ("page not found", "404 error", "page you are looking for")
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+class PageMissing(Exception):
+    pass
 
-    data["content_sections"] = all_sections
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+PAGE_NO_RE = re.compile(r"[?&]pageNo=(\d+)")
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
 
-    return data
+def canonical_url(url):
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
 
-def extract_cut_off_data(driver, URLS):
-    driver.get(URLS["cut_off"])
+    # Listing pages only differ by ?pageNo=, and past the last one the site
+    # redirects back to the first
+    page_no = PAGE_NO_RE.search(url)
+    return host, parts.path.rstrip("/").lower(), page_no.group(1) if page_no else None
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+def check_redirect(requested_url, final_url):
+    if canonical_url(requested_url) != canonical_url(final_url):
+        raise PageMissing(f"redirected to {final_url}")
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
 
-    data = {}
+def looks_like_not_found(title, heading):
+    text = f"{title or ''} {heading or ''}".lower()
+    return any(marker in text for marker in NOT_FOUND_MARKERS)
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+def check_not_found_soup(soup):
+    if isinstance(soup, PageMarkup):
+        title, heading = soup.first_text("//title"), soup.first_text("//h1")
+    else:
+        h1 = soup.find("h1")
+        title = soup.title.get_text(strip=True) if soup.title else None
+        heading = h1.get_text(strip=True) if h1 else None
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+    if looks_like_not_found(title, heading):
+        raise PageMissing("not found template")
 
-    data["author"] = author_data
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+def fetch_http_response(url):
+    acquire_slot()
+    healthy = False
+    started = time.monotonic()
+    try:
+        response = get_http_session().get(url, timeout=HTTP_TIMEOUT)
+
+        title = TITLE_RE.search(response.content[:CHALLENGE_SCAN_BYTES])
+        response.challenged = looks_like_challenge(
+            title.group(1).decode("utf-8", "replace") if title else None
+        )
+
+        healthy = (
+            response.status_code < 500
+            and response.status_code not in THROTTLE_STATUSES
+            and not response.challenged
+        )
+        return response
+    finally:
+        release_slot(time.monotonic() - started, healthy)
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
 
-    data["content_sections"] = all_sections
+def fetch_http_soup(url, selectors=REQUIRED_SELECTORS, partial=False, markup_only=False):
+    started = time.monotonic()
+    try:
+        response = fetch_http_response(url)
+    except requests.RequestException as e:
+        print(f"HTTP fetch failed for {url}:", e)
+        return None
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+    if response.status_code in (404, 410):
+        raise PageMissing(f"HTTP {response.status_code}")
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    if response.status_code != 200 or response.challenged:
+        return None
 
-    return data
+    check_redirect(url, response.url)
 
-def extract_app_form_data(driver, URLS):
-    driver.get(URLS["app_form"])
+    # Raw bytes so BeautifulSoup picks the charset from the page itself
+    html = response.content
+    soup = make_fetched_page(html, partial, markup_only)
+    check_not_found_soup(soup)
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+    if not has_required_content(soup, selectors):
+        # The missing parts may be a JSON call away instead of a browser away
+        completed = complete_from_apis(url, html, selectors, partial, markup_only)
+        if completed is None:
+            return None
+        html, soup = completed
+
+    store_page(url, html, "http", time.monotonic() - started)
+    return soup
+
+
+def open_in_browser(driver, url, page_type=None, selectors=DETAIL_SELECTORS):
+    driver.get(url)
+    check_redirect(url, driver.current_url)
 
-    # Scroll to bottom (for lazy loading content)
+    # Kick off lazy loading, then wait for the DOM to settle
     driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    timeout = page_timeout(page_type)
+    if not wait_until_ready(driver, selectors, timeout):
+        # Pages without content sections are fine, pages without a title are not
+        if not driver.find_elements(By.TAG_NAME, "h1"):
+            if looks_like_not_found(driver.title, None):
+                raise PageMissing("not found template")
+            raise TimeoutException(f"No h1 on {url} after {timeout}s")
 
-    data = {}
+    record_network_stats(driver)
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+def fetch_browser_soup(
+    driver, url, page_type=None, selectors=DETAIL_SELECTORS, partial=False, markup_only=False
+):
+    started = time.monotonic()
+    open_in_browser(driver, url, page_type, selectors)
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+    html = driver.page_source
+    soup = make_fetched_page(html, partial, markup_only)
+    check_not_found_soup(soup)
 
-    data["author"] = author_data
+    store_page(url, html, "browser", time.monotonic() - started)
+    return soup
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+def fetch_page_soup(
+    driver,
+    url,
+    page_type=None,
+    selectors=REQUIRED_SELECTORS,
+    incremental=True,
+    partial=False,
+    markup_only=False,
+):
+    if RUN_CONFIG["replay"]:
+        return replay_page_soup(url, partial, markup_only)
 
-    data["content_sections"] = all_sections
+    try:
+        soup = fetch_http_soup(url, selectors, partial, markup_only)
+        if soup is None:
+            soup = fetch_browser_soup(driver, url, page_type, selectors, partial, markup_only)
+    except PageMissing as e:
+        store_page(url, None, "check", missing=str(e))
+        raise
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+    if incremental and RUN_CONFIG["incremental"]:
+        check_unchanged(url, soup)
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    return soup
 
-    return data
 
-def extract_sel_proccess_data(driver, URLS):
-    driver.get(URLS["sel_proccess"])
+# ---------------- INCREMENTAL CRAWL ----------------
+# With --incremental, each page's "Updated" text and a hash of the text we
+# extract from are compared with the previous run. PageUnchanged carries the
+# previous extraction so it is reused instead of parsing the page again.
+CRAWL_STATE = os.path.join(CACHE_DIR, "crawl_state.json")
+# Bump whenever the extracted output changes shape or content, so pages
+# carried forward from an older extractor are extracted again
+EXTRACTOR_VERSION = 3
+FINGERPRINT_SELECTORS = "h1, .ppBox, .sectionalWrapperClass, .flx-box, .facb5f, .poll-container"
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+PREVIOUS_PAGES = None
+PAGE_STATES = None
+PENDING_STATES = {}
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+INCREMENTAL_STATS = {
+    "unchanged": 0,
+    "changed": 0,
+}
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
 
-    data = {}
+class PageUnchanged(Exception):
+    def __init__(self, url, data):
+        super().__init__(f"{url} unchanged since last run")
+        self.data = data
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+def load_previous_pages():
+    global PREVIOUS_PAGES
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+    if PREVIOUS_PAGES is None:
+        PREVIOUS_PAGES = {}
 
-    data["author"] = author_data
+        for record in load_json(RUN_CONFIG["previous_output"], []):
+            exam_data = record.get("exam_data") or {}
+            if not exam_data.get("base_url"):
+                continue
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+            for key, url in build_exam_urls(exam_data["base_url"]).items():
+                if exam_data.get(key) is not None:
+                    PREVIOUS_PAGES[url] = exam_data[key]
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+    return PREVIOUS_PAGES
 
-    data["content_sections"] = all_sections
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+def load_page_states():
+    global PAGE_STATES
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    if PAGE_STATES is None:
+        PAGE_STATES = load_json(CRAWL_STATE, {})
+    return PAGE_STATES
 
-    return data
 
-def extract_answerkey_data(driver, URLS):
-    driver.get(URLS["ans_key"])
+def fingerprint_texts(texts):
+    digest = hashlib.sha256()
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+    for text in texts:
+        digest.update(" ".join(text.split()).encode("utf-8"))
+        digest.update(b"\0")
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+    return digest.hexdigest()
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
 
-    data = {}
+def content_fingerprint(soup):
+    return fingerprint_texts(
+        node.get_text(" ", strip=True) for node in soup.select(FINGERPRINT_SELECTORS)
+    )
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
+def check_unchanged(url, soup):
     updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+    check_page_state(
+        url,
+        updated_span.get_text(strip=True) if updated_span else None,
+        content_fingerprint(soup),
+    )
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
 
-    data["author"] = author_data
+def extractor_version():
+    # FAQs and the author come from elsewhere without JSON-LD
+    if RUN_CONFIG["structured_data"]:
+        return str(EXTRACTOR_VERSION)
+    return f"{EXTRACTOR_VERSION}-dom"
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+def check_page_state(url, updated_on, content_hash):
+    state = {
+        "updated_on": updated_on,
+        "content_hash": content_hash,
+        "extractor": extractor_version(),
+        "checked_at": time.time(),
+    }
 
-    data["content_sections"] = all_sections
+    previous_state = load_page_states().get(url)
+    previous_data = load_previous_pages().get(url)
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+    if (
+        previous_state
+        and previous_data is not None
+        and previous_state["updated_on"] == state["updated_on"]
+        and previous_state["content_hash"] == state["content_hash"]
+        and previous_state.get("extractor") == state["extractor"]
+    ):
+        INCREMENTAL_STATS["unchanged"] += 1
+        raise PageUnchanged(url, previous_data)
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    INCREMENTAL_STATS["changed"] += 1
+    PENDING_STATES[url] = state
 
-    return data
 
-def extract_Counselling_data(driver, URLS):
-    driver.get(URLS["counselling"])
+def commit_page_states(urls):
+    states = {url: PENDING_STATES.pop(url) for url in urls if url in PENDING_STATES}
+    if not states:
+        return
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+    update_json(CRAWL_STATE, states)
+    load_page_states().update(states)
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+def print_incremental_stats():
+    print(
+        f"🔁 Unchanged pages carried forward: {INCREMENTAL_STATS['unchanged']}, "
+        f"re-extracted: {INCREMENTAL_STATS['changed']}"
+    )
 
-    data = {}
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+# ---------------- NEGATIVE CACHE ----------------
+# Pages found missing are remembered for NEGATIVE_CACHE_TTL, together with
+# what it cost to find that out, so later runs can skip them outright.
+NEGATIVE_CACHE = os.path.join(CACHE_DIR, "missing_pages.json")
+NEGATIVE_CACHE_TTL = 3 * 24 * 3600
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+NEGATIVE_CACHE_STATS = {
+    "recorded": 0,
+    "skipped": 0,
+    "seconds_saved": 0.0,
+}
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
 
-    data["author"] = author_data
+def unexpired(entries):
+    now = time.time()
+    return {
+        url: entry
+        for url, entry in entries.items()
+        if now - entry["checked_at"] < NEGATIVE_CACHE_TTL
+    }
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+def load_negative_cache():
+    return unexpired(load_json(NEGATIVE_CACHE, {}))
 
-    data["content_sections"] = all_sections
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+def record_missing_pages(entries):
+    if not entries:
+        return
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    update_json(NEGATIVE_CACHE, entries, prune=unexpired)
 
-    return data
+    NEGATIVE_CACHE_STATS["recorded"] += len(entries)
 
-def extract_Analysis_data(driver, URLS):
-    driver.get(URLS["analysis"])
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
+def print_negative_cache_stats():
+    print(
+        f"🚫 Missing pages recorded: {NEGATIVE_CACHE_STATS['recorded']}, "
+        f"skipped from cache: {NEGATIVE_CACHE_STATS['skipped']} "
+        f"(~{NEGATIVE_CACHE_STATS['seconds_saved']:.0f}s saved)"
     )
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+# ---------------- API DISCOVERY ----------------
+# Listing cards and some exam page sections arrive through background JSON
+# requests, which is what the scroll/wait cycles in Chrome are for.
+# --discover-apis loads a few pages in Chrome and records every JSON
+# XHR/fetch response that carries the markup we parse. The endpoints are
+# saved, with the page number or page URL turned into placeholders, to
+# API_MANIFEST. Normal runs replay them over plain HTTP when a page's own
+# HTML is missing those parts. If an endpoint stops answering with the shape
+# it had at discovery, it is dropped for the run and the page goes to
+# Chrome as before.
+API_MANIFEST = "api_endpoints.json"
+API_MARKERS = {
+    "listing": ("uilp_exam_card",),
+    "detail": ("sectionalWrapperClass", "flx-box", "poll-container", "ppBox"),
+}
+API_REPLAY_HEADERS = ("accept", "content-type", "x-requested-with")
+API_SHAPE_DEPTH = 2
+DISCOVERY_LISTING_PAGE = 2
 
-    data = {}
+NETWORK_CAPTURE = None
+API_ENDPOINTS = None
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+API_STATS = {
+    "calls": 0,
+    "pages_completed": 0,
+    "endpoints_dropped": 0,
+}
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+class ApiChanged(Exception):
+    pass
 
-    data["author"] = author_data
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+def json_shape(value, depth=API_SHAPE_DEPTH, prefix=""):
+    keys = set()
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+    if isinstance(value, list) and value:
+        keys |= json_shape(value[0], depth, prefix + "[]")
+    elif isinstance(value, dict) and depth > 0:
+        for key, child in value.items():
+            path = f"{prefix}.{key}" if prefix else key
+            keys.add(path)
+            keys |= json_shape(child, depth - 1, path)
 
-    data["content_sections"] = all_sections
+    return keys
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+def html_fragments(value):
+    # Lazy sections usually come back as rendered markup inside the JSON
+    if isinstance(value, str):
+        return [value] if "<" in value and ">" in value else []
+    if isinstance(value, list):
+        return [fragment for child in value for fragment in html_fragments(child)]
+    if isinstance(value, dict):
+        return [fragment for child in value.values() for fragment in html_fragments(child)]
+    return []
 
-    return data
 
-def extract_question_paper_data(driver, URLS):
-    driver.get(URLS["question_paper"])
+def api_placeholders(page_url):
+    path = urlsplit(page_url).path
+    match = PAGE_NO_RE.search(page_url)
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+    # Longest first, so the full URL wins over the path inside it
+    return [
+        ("{page_url}", page_url),
+        ("{page_url_quoted}", quote(page_url, safe="")),
+        ("{page_path}", path),
+        ("{page_path_quoted}", quote(path, safe="")),
+        ("{page_no}", match.group(1) if match else "1"),
+    ]
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+def make_api_template(text, page_url, kind):
+    if not text:
+        return text, False
 
-    data = {}
+    templated = text
+    for placeholder, value in api_placeholders(page_url):
+        if placeholder != "{page_no}":
+            templated = templated.replace(value, placeholder)
+        elif kind == "listing":
+            # Only a whole query or JSON value, "2" shows up everywhere else
+            templated = re.sub(
+                rf"(?<=[=:\"]){re.escape(value)}(?=[\"&,}}]|$)", placeholder, templated
+            )
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+    return templated, templated != text
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+def fill_api_template(text, page_url):
+    if not text:
+        return text
 
-    data["author"] = author_data
+    for placeholder, value in api_placeholders(page_url):
+        text = text.replace(placeholder, value)
+    return text
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+def load_api_endpoints():
+    global API_ENDPOINTS
+
+    if API_ENDPOINTS is None:
+        API_ENDPOINTS = load_json(API_MANIFEST, {}).get("endpoints", [])
+    return API_ENDPOINTS
 
-    data["content_sections"] = all_sections
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+def capture_json_responses(driver, messages):
+    requests_by_id = {}
+    responses = []
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    for message in messages:
+        params = message.get("params", {})
 
-    return data
+        if message.get("method") == "Network.requestWillBeSent":
+            requests_by_id[params["requestId"]] = params["request"]
 
-def extract_admit_card_data(driver, URLS):
-    driver.get(URLS["admit_card"])
+        elif message.get("method") == "Network.responseReceived":
+            if params.get("type") not in ("XHR", "Fetch"):
+                continue
+            if "json" not in params["response"].get("mimeType", ""):
+                continue
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+            try:
+                body = driver.execute_cdp_cmd(
+                    "Network.getResponseBody", {"requestId": params["requestId"]}
+                )
+            except WebDriverException:
+                continue  # evicted or still streaming
+
+            text = body["body"]
+            if body.get("base64Encoded"):
+                text = base64.b64decode(text).decode("utf-8", "replace")
+
+            request = requests_by_id.get(params["requestId"], {})
+            responses.append({
+                "url": params["response"]["url"],
+                "method": request.get("method", "GET"),
+                "post_data": request.get("postData"),
+                "headers": {
+                    name.lower(): value
+                    for name, value in request.get("headers", {}).items()
+                    if name.lower() in API_REPLAY_HEADERS
+                },
+                "body": text,
+            })
+
+    return responses
+
+
+def api_endpoints_from(responses, page_url, kind):
+    endpoints = []
+
+    for response in responses:
+        try:
+            payload = json.loads(response["body"])
+        except ValueError:
+            continue
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+        markup = "".join(html_fragments(payload))
+        markers = [marker for marker in API_MARKERS[kind] if marker in markup]
+        if not markers:
+            continue
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+        url, url_templated = make_api_template(response["url"], page_url, kind)
+        post_data, post_templated = make_api_template(response["post_data"], page_url, kind)
 
-    data = {}
+        # Without a placeholder every exam would get this page's content
+        if not (url_templated or post_templated):
+            print(f"  skipping {response['url']}: doesn't depend on the page URL")
+            continue
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+        endpoints.append({
+            "kind": kind,
+            "method": response["method"],
+            "url": url,
+            "post_data": post_data,
+            "headers": response["headers"],
+            "shape": sorted(json_shape(payload)),
+            "markers": markers,
+        })
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+    return endpoints
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
 
-    data["author"] = author_data
+def discover_apis(driver):
+    def capture(load, page_url, kind):
+        global NETWORK_CAPTURE
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+        NETWORK_CAPTURE = []
+        try:
+            load()
+        except Exception as e:
+            print(f"  {page_url} failed to load:", e)
+            return []
+        finally:
+            messages, NETWORK_CAPTURE = NETWORK_CAPTURE, None
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+        return api_endpoints_from(capture_json_responses(driver, messages), page_url, kind)
 
-    data["content_sections"] = all_sections
+    endpoints = []
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+    # Page 2, so the page number has something other than 1 to be spotted by
+    listing_url = listing_page_url(DISCOVERY_LISTING_PAGE)
+    print(f"Recording {listing_url}")
+    soup = None
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    def load_listing():
+        nonlocal soup
+        soup = fetch_listing_browser_soup(driver, DISCOVERY_LISTING_PAGE)
 
-    return data
+    endpoints += capture(load_listing, listing_url, "listing")
 
-def extract_dates_data(driver, URLS):
-    driver.get(URLS["dates"])
+    exams = parse_listing_soup(soup) if soup is not None else []
+    if exams:
+        for key, page_url in build_exam_urls(exams[0]["base_url"]).items():
+            print(f"Recording {page_url}")
+            endpoints += capture(
+                lambda: open_in_browser(driver, page_url, key, PAGE_TYPES[key]["selectors"]),
+                page_url,
+                "detail",
+            )
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+    # Same endpoint seen from several pages only needs one entry
+    unique = {}
+    for endpoint in endpoints:
+        unique.setdefault((endpoint["method"], endpoint["url"], endpoint["post_data"]), endpoint)
+    endpoints = list(unique.values())
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+    write_json_atomic(API_MANIFEST, {
+        "discovered_at": time.time(),
+        "endpoints": endpoints,
+    }, indent=2)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    print(f"🔎 Found {len(endpoints)} replayable JSON endpoint(s), saved to {API_MANIFEST}")
+    for endpoint in endpoints:
+        print(f"   {endpoint['kind']}: {endpoint['method']} {endpoint['url']} {endpoint['markers']}")
 
-    data = {}
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+def fetch_api_markup(endpoint, page_url):
+    url = fill_api_template(endpoint["url"], page_url)
+    post_data = fill_api_template(endpoint["post_data"], page_url)
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+    acquire_slot()
+    healthy = False
+    started = time.monotonic()
+    try:
+        response = get_http_session().request(
+            endpoint["method"], url, data=post_data, headers=endpoint["headers"], timeout=HTTP_TIMEOUT
+        )
+        API_STATS["calls"] += 1
+        healthy = response.status_code < 500 and response.status_code not in THROTTLE_STATUSES
+    finally:
+        release_slot(time.monotonic() - started, healthy)
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+    # Throttling and server errors pass, and an exam without that section
+    # simply has no fragment; only other statuses mean the call itself changed
+    if response.status_code in THROTTLE_STATUSES or response.status_code >= 500:
+        raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+    if response.status_code in (404, 410):
+        return ""
+    if response.status_code != 200:
+        raise ApiChanged(f"HTTP {response.status_code}")
 
-    data["author"] = author_data
+    try:
+        payload = response.json()
+    except ValueError:
+        raise ApiChanged("response is not JSON any more")
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+    missing = set(endpoint["shape"]) - json_shape(payload)
+    if missing:
+        raise ApiChanged(f"missing keys {sorted(missing)[:5]}")
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+    return "".join(html_fragments(payload))
 
-    data["content_sections"] = all_sections
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+def complete_from_apis(page_url, markup, selectors, partial=False, markup_only=False):
+    if not RUN_CONFIG["apis"]:
+        return None
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    kind = "listing" if page_url.startswith(LISTING_URL) else "detail"
+    endpoints = [e for e in load_api_endpoints() if e["kind"] == kind and not e.get("dropped")]
+    if not endpoints:
+        return None
 
-    return data
+    if isinstance(markup, bytes):
+        markup = UnicodeDammit(markup, is_html=True).unicode_markup
 
-def extract_mock_test_data(driver, URLS):
-    driver.get(URLS["mock_test"])
+    for endpoint in endpoints:
+        try:
+            fragment = fetch_api_markup(endpoint, page_url)
+        except ApiChanged as e:
+            print(f"⚠️ API {endpoint['url']} changed ({e}), falling back to the browser")
+            endpoint["dropped"] = True
+            API_STATS["endpoints_dropped"] += 1
+            continue
+        except requests.RequestException as e:
+            print(f"API fetch failed for {page_url}:", e)
+            continue
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
+        if not fragment:
+            continue
+
+        markup += fragment
+        soup = make_fetched_page(markup, partial, markup_only)
+        if has_required_content(soup, selectors):
+            API_STATS["pages_completed"] += 1
+            return markup, soup
+
+    return None
+
+
+def print_api_stats():
+    print(
+        f"🔌 API calls: {API_STATS['calls']}, pages completed without Chrome: "
+        f"{API_STATS['pages_completed']}, endpoints dropped: {API_STATS['endpoints_dropped']}"
     )
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+# ---------------- IMPORTANT DATES ----------------
+# Listing cards give dates as text like "15 Nov '25 - 20 Nov '25",
+# "28 - 30 Jan '26", "Dec '25" or "15 Nov '25 (Tentative)". date_entry turns
+# that into ISO start/end dates plus a tentative/confirmed status, keeping
+# the original text. A month without a day spans the whole month, and text
+# that doesn't parse gets no dates and no status.
+MONTH_NAMES = [
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+]
+MONTHS = {name: number for number, name in enumerate(MONTH_NAMES, 1)}
+MONTHS.update({name[:3]: number for name, number in list(MONTHS.items())})
+MONTHS["sept"] = 9
+TENTATIVE_RE = re.compile(r"\b(?:tentative|expected|tba|tbd|to be (?:announced|notified))\b", re.IGNORECASE)
+RANGE_SPLIT_RE = re.compile(r"\s*(?:[-–—]|\bto\b)\s*", re.IGNORECASE)
+DATE_PART_RE = re.compile(
+    r"(?:(?P<day>\d{1,2})(?:st|nd|rd|th)?\s*)?"
+    r"(?:(?P<month>" + "|".join(sorted(MONTHS, key=len, reverse=True)) + r")\.?,?\s*)?"
+    r"(?:'\s*(?P<short_year>\d{2})|(?P<year>\d{4}))?",
+    re.IGNORECASE,
+)
+
+
+def date_part(text):
+    match = DATE_PART_RE.fullmatch(text.strip(" ,()"))
+    if not match or not any(match.groups()):
+        return None
+
+    month = MONTHS[match["month"].lower()] if match["month"] else None
+
+    if match["short_year"]:
+        year = 2000 + int(match["short_year"])
+    else:
+        year = int(match["year"]) if match["year"] else None
 
-    data = {}
+    return [int(match["day"]) if match["day"] else None, month, year]
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+def iso_date(day, month, year, last=False):
+    if month is None or year is None:
+        return None
+    if day is None:
+        day = calendar.monthrange(year, month)[1] if last else 1
+    try:
+        return datetime.date(year, month, day).isoformat()
+    except ValueError:
+        return None
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
 
-    data["author"] = author_data
+# Listing pages repeat the same few hundred date strings across every card
+@functools.lru_cache(maxsize=4096)
+def parse_date_range(text):
+    tentative = bool(TENTATIVE_RE.search(text))
+    cleaned = TENTATIVE_RE.sub("", text).replace("(", " ").replace(")", " ").strip()
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+    parts = [date_part(part) for part in RANGE_SPLIT_RE.split(cleaned, maxsplit=1) if part]
+    start = end = None
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+    if parts and all(parts):
+        first, last = parts[0], parts[-1]
 
-    data["content_sections"] = all_sections
+        # "28 - 30 Jan '26", "28 Jan - 2 Feb '26"
+        start_year_shared, end_year_shared = first[2] is None, last[2] is None
+        for i in (1, 2):
+            if first[i] is None:
+                first[i] = last[i]
+        if last[2] is None:
+            last[2] = first[2]
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+        # "20 Dec - 5 Jan '26" starts the year before, "20 Dec '25 - 5 Jan"
+        # ends the year after
+        if first[2] is not None and (first[1], first[0] or 1) > (last[1], last[0] or 1):
+            if start_year_shared:
+                first[2] -= 1
+            elif end_year_shared:
+                last[2] += 1
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+        start = iso_date(*first)
+        end = iso_date(*last, last=True)
 
-    return data
+    if start is None or end is None or end < start:
+        start = end = None
 
-def extract_registration_data(driver, URLS):
-    driver.get(URLS["registration"])
+    if start is None:
+        return None, None, None
+    return start, end, "tentative" if tentative else "confirmed"
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+def date_entry(date_text, event):
+    start, end, status = parse_date_range(date_text)
+    return {
+        "date": date_text,
+        "start": start,
+        "end": end,
+        "status": status,
+        "event": event,
+    }
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
 
-    data = {}
+# ---------------- LISTING SCRAPER ----------------
+LISTING_FETCH_WORKERS = 8
+# Hard stop for probing past the pagination, in case the site keeps
+# answering with fresh-looking pages
+MAX_LISTING_PAGES = 200
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+def listing_page_url(page_no):
+    if page_no == 1:
+        return LISTING_URL
+    return f"{LISTING_URL}?pageNo={page_no}"
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
 
-    data["author"] = author_data
+def fetch_listing_http_soup(page_no):
+    try:
+        return fetch_http_soup(listing_page_url(page_no), LISTING_SELECTORS)
+    except PageMissing as e:
+        # Past the last page the site redirects back to the first one
+        print(f"Listing page {page_no} missing: {e}")
+        return False
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+def fetch_listing_browser_soup(driver, page_no):
+    url = listing_page_url(page_no)
 
-    data["content_sections"] = all_sections
+    started = time.monotonic()
+    driver.get(url)
+    check_redirect(url, driver.current_url)
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+    timeout = LISTING_TIMEOUT
+    if not wait_until_ready(driver, LISTING_SELECTORS, timeout):
+        if not driver.find_elements(By.CLASS_NAME, "uilp_exam_card"):
+            raise TimeoutException(f"No exam cards on {url} after {timeout}s")
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    scroll_to_bottom(driver, timeout=timeout, selectors=LISTING_SELECTORS)
+    record_network_stats(driver)
 
-    return data
+    html = driver.page_source
+    store_page(url, html, "browser", time.monotonic() - started)
+    return make_soup(html)
 
-def extract_syllabus_data(driver, URLS):
-    driver.get(URLS["syllabus"])
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+def fetch_listing_soup(driver, page_no=1):
+    if RUN_CONFIG["replay"]:
+        return replay_page_soup(listing_page_url(page_no))
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+    soup = fetch_listing_http_soup(page_no)
+    if soup is False:
+        return None
+    if soup is None:
+        try:
+            soup = fetch_listing_browser_soup(driver, page_no)
+        except PageMissing as e:
+            print(f"Listing page {page_no} missing: {e}")
+            return None
+    return soup
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
 
-    data = {}
+def listing_page_count(soup):
+    pages = [1]
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+    for link in soup.find_all("a", href=True):
+        match = PAGE_NO_RE.search(link["href"])
+        if match:
+            pages.append(int(match.group(1)))
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+    return max(pages)
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
 
-    data["author"] = author_data
+def scrape_listing_page(driver, page_no=1):
+    soup = fetch_listing_soup(driver, page_no)
+    return parse_listing_soup(soup) if soup is not None else []
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+def listing_has_cards(soup):
+    return soup is not None and has_required_content(soup, LISTING_SELECTORS)
 
-    data["content_sections"] = all_sections
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+def fetch_listing_pages(driver, page_numbers, soups, probing=False):
+    pending = [page for page in page_numbers if page not in soups]
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    # Plain HTTP pages can all be in flight at once, the browser can't
+    if pending and not RUN_CONFIG["replay"]:
+        with ThreadPoolExecutor(max_workers=LISTING_FETCH_WORKERS) as executor:
+            for page, soup in zip(pending, executor.map(fetch_listing_http_soup, pending)):
+                if soup is not None:
+                    soups[page] = soup or None
 
-    return data
+    for page in page_numbers:
+        if page not in soups:
+            print(f"Scraping listing page {page}")
+            try:
+                soups[page] = fetch_listing_soup(driver, page)
+            except PageNotCached as e:
+                print(e)
+                soups[page] = None
+            except TimeoutException as e:
+                # Past the end a page may just render without cards
+                if not probing:
+                    raise
+                print(e)
+                soups[page] = None
+
+
+def scrape_all_listing_pages(driver, first_page=1, last_page=None):
+    first_soup = fetch_listing_soup(driver, 1)
+    if first_soup is None:
+        return []
+
+    soups = {1: first_soup}
+    linked = min(listing_page_count(first_soup), MAX_LISTING_PAGES)
+    end = min(last_page, linked) if last_page else linked
+    fetch_listing_pages(driver, range(first_page, end + 1), soups)
+
+    seen_urls = {
+        exam["exam_full_url"]
+        for soup in soups.values() if soup is not None
+        for exam in parse_listing_soup(soup)
+    }
+
+    # The pagination only links a window of pages, so keep going past the
+    # highest link until a page comes back without exam cards. Some sites
+    # answer an out-of-range pageNo with the last (or first) page again, so
+    # a page with no exams we haven't seen ends the listing as well.
+    end = max(end, first_page - 1)
+    done = False
+    while not done and end < (last_page or MAX_LISTING_PAGES):
+        batch_end = min(end + LISTING_FETCH_WORKERS, last_page or MAX_LISTING_PAGES)
+        batch = range(end + 1, batch_end + 1)
+        fetch_listing_pages(driver, batch, soups, probing=True)
+
+        for page in batch:
+            urls = set()
+            if listing_has_cards(soups[page]):
+                urls = {exam["exam_full_url"] for exam in parse_listing_soup(soups[page])}
+
+            if not urls - seen_urls:
+                done = True
+                break
 
-def extract_pattern_data(driver, URLS):
-    driver.get(URLS["pattern"])
+            seen_urls |= urls
+            end = page
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+    page_numbers = list(range(first_page, end + 1))
+    print(f"Listing pages {first_page}-{end} scraped ({linked} linked from the first page)")
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+    # Exams can shift between pages while we crawl, keep the first sighting
+    exams = []
+    seen = set()
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    for page in page_numbers:
+        if soups[page] is None:
+            continue
 
-    data = {}
+        for exam in parse_listing_soup(soups[page]):
+            if exam["exam_full_url"] in seen:
+                continue
+            seen.add(exam["exam_full_url"])
+            exams.append(exam)
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+    return exams
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+def parse_listing_soup(soup):
+    all_exams = []
 
-    data["author"] = author_data
+    cards = soup.select(".uilp_exam_card")
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+    for card in cards:
+        result = {}
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+        exam_title = card.select_one(".exam_title")
 
-    data["content_sections"] = all_sections
+        if exam_title:
+            result["exam_short_name"] = exam_title.get_text(strip=True)
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+            relative_link = exam_title.get("href")
+            result["exam_relative_url"] = relative_link
+            result["exam_full_url"] = urljoin(BASE, relative_link)
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+            # Base URL for further pattern/syllabus scraping
+            result["base_url"] = urljoin(BASE, relative_link).rstrip("/")
+        else:
+            continue
 
-    return data
+        # Full Exam Name
+        full_name = card.select_one(".exam_flnm")
+        result["exam_full_name"] = full_name.get_text(strip=True) if full_name else None
 
-def extract_preparation_data(driver, URLS):
-    driver.get(URLS["preparation"])
+        # Important Dates
+        result["important_dates"] = []
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+        rows = card.select(".exam_impdates table tr")
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+        for row in rows:
+            date_col = row.select_one(".fix-tdwidth p")
+            event_col = row.select_one(".fix-textlength p")
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+            if date_col and event_col:
+                result["important_dates"].append(date_entry(
+                    " ".join(date_col.get_text().split()),
+                    event_col.get_text(strip=True)
+                ))
 
-    data = {}
+        all_exams.append(result)
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+    return all_exams
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
 
-    data["author"] = author_data
+# 🔥 Scrape Multiple Pages
+# all_exams = []
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+# for page in range(1, 5):   # 1 se 4 tak
+#     print(f"Scraping page {page}")
+#     data = scrape_listing_page(driver, page)
+#     all_exams.extend(data)
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+# print("Total exams scraped:", len(all_exams))
 
-    data["content_sections"] = all_sections
+# ---------------- STRUCTURED DATA ----------------
+# Many pages carry schema.org JSON-LD (FAQPage, Article with its author).
+# A regex over the raw markup finds those blocks without the per-question
+# lookups faq_entry does, and they don't break when the site renames classes
+# like facb5f or ePPDetail. FAQs come from the JSON-LD when it has them; the
+# author only when the page has no ppBox, so all of its fields come from one
+# place. The shared walk in scan_exam_page still runs for everything else.
+# title stays the h1 (a headline is often longer) and updated_on the
+# "Updated on ..." text rather than the ISO dateModified.
+JSON_LD_PATTERN = r"<script[^>]*type\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>"
+JSON_LD_RE = re.compile(JSON_LD_PATTERN, re.IGNORECASE | re.DOTALL)
+JSON_LD_BYTES_RE = re.compile(JSON_LD_PATTERN.encode(), re.IGNORECASE | re.DOTALL)
+ARTICLE_TYPES = {"article", "newsarticle", "blogposting", "webpage"}
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+def json_ld_blocks(markup):
+    if isinstance(markup, bytes):
+        return [m.decode("utf-8", "replace") for m in JSON_LD_BYTES_RE.findall(markup)]
+    return JSON_LD_RE.findall(markup or "")
 
-    return data
 
-def extract_books_data(driver, URLS):
-    driver.get(URLS["books"])
+def as_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+def json_ld_items(blocks):
+    items = []
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    for block in blocks:
+        try:
+            value = json.loads(block)
+        except ValueError:
+            continue  # sites do ship broken JSON-LD
 
-    data = {}
+        for item in as_list(value):
+            if isinstance(item, dict):
+                items.append(item)
+                items.extend(i for i in as_list(item.get("@graph")) if isinstance(i, dict))
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+    return items
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+def item_types(item):
+    return {str(t).lower() for t in as_list(item.get("@type"))}
 
-    data["author"] = author_data
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+def plain_text(value):
+    if not isinstance(value, str):
+        return None
+    if "<" not in value and "&" not in value:
+        return " ".join(value.split()) or None
+    # Answers are often HTML, entities included
+    text = make_soup(value).get_text(" ", strip=True)
+    return text or None
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
 
-    data["content_sections"] = all_sections
+def structured_author(value):
+    for author in as_list(value):
+        if isinstance(author, str):
+            return {"name": author.strip() or None, "profile_url": None, "role": None, "image": None}
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+        if isinstance(author, dict) and author.get("name"):
+            image = author.get("image")
+            if isinstance(image, dict):
+                image = image.get("url")
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+            return {
+                "name": plain_text(author.get("name")),
+                "profile_url": author.get("url"),
+                "role": plain_text(author.get("jobTitle")),
+                "image": image if isinstance(image, str) else None,
+            }
 
-    return data
+    return None
 
-def extract_notification_data(driver, URLS):
-    driver.get(URLS["notification"])
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+def structured_faqs(item):
+    faqs = []
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+    for question in as_list(item.get("mainEntity")):
+        if not isinstance(question, dict):
+            continue
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+        answer = next(iter(as_list(question.get("acceptedAnswer"))), None)
+        if not isinstance(answer, dict):
+            continue
 
-    data = {}
+        # Same prefixes faq_entry strips from the page
+        q = (plain_text(question.get("name")) or "").replace("Q:", "").strip()
+        a = (plain_text(answer.get("text")) or "").replace("A:", "").strip()
+        if q and a:
+            faqs.append({"question": q, "answer": a})
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+    return faqs
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+def structured_fields(blocks):
+    fields = {}
 
-    data["author"] = author_data
+    for item in json_ld_items(blocks):
+        types = item_types(item)
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+        if "faqpage" in types and "faqs" not in fields:
+            faqs = structured_faqs(item)
+            if faqs:
+                fields["faqs"] = faqs
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+        if types & ARTICLE_TYPES and "author" not in fields:
+            author = structured_author(item.get("author"))
+            if author:
+                fields["author"] = author
 
-    data["content_sections"] = all_sections
+    return fields
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+def structured_page_data(markup):
+    if not RUN_CONFIG["structured_data"]:
+        return {}
+    return structured_fields(json_ld_blocks(markup))
+
+
+# For data the DOM path already produced (in-browser extraction)
+def apply_structured_data(data, structured):
+    if "faqs" in structured:
+        data["faqs"] = structured["faqs"]
+
+    if not data["author"] and "author" in structured:
+        data["author"] = structured["author"]
+
+    return data
+
+
+# ---------------- PAGE EXTRACTOR ----------------
+# Every exam sub-page shares one layout, so one engine fetches and parses
+# them all; what differs per page type lives in PAGE_TYPES.
+def has_updated_text(string):
+    return string and "Updated" in string
+
+
+def scan_exam_page(soup):
+    found = {
+        "h1": None,
+        "updated_span": None,
+        "author_block": None,
+        "sections": [],
+        "faq_questions": [],
+        "poll_containers": [],
+    }
+
+    # One pass over the tree, in document order, picking up every element
+    # the page fields are built from
+    for element in soup.descendants:
+        if not isinstance(element, Tag):
+            continue
+
+        name = element.name
+        classes = element.get("class") or ()
+
+        if name == "h1":
+            if found["h1"] is None:
+                found["h1"] = element
+
+        elif name == "span":
+            if found["updated_span"] is None and has_updated_text(element.string):
+                found["updated_span"] = element
+
+        elif name == "div":
+            if "sectionalWrapperClass" in classes:
+                found["sections"].append(element)
+            if "poll-container" in classes:
+                found["poll_containers"].append(element)
+            if "ppBox" in classes and found["author_block"] is None:
+                found["author_block"] = element
 
-    return data
+        elif name == "strong":
+            if "flx-box" in classes:
+                found["faq_questions"].append(element)
 
-def extract_center_data(driver, URLS):
-    driver.get(URLS["centre"])
+    return found
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+def author_info(author_block):
+    if not author_block:
+        return {}
+
+    author_link = author_block.find("a")
+    img = author_block.find("img")
+    role = author_block.find("p", class_="ePPDetail")
+
+    return {
+        "name": author_link.get_text(strip=True) if author_link else None,
+        "profile_url": author_link["href"] if author_link else None,
+        "role": role.get_text(" ", strip=True) if role else None,
+        "image": img["src"] if img else None
+    }
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
 
+def parse_exam_page(soup, extras=(), structured=None):
+    structured = structured or {}
+    found = scan_exam_page(soup)
     data = {}
 
     # =====================================
     # TITLE
     # =====================================
-    h1 = soup.find("h1")
+    h1 = found["h1"]
     data["title"] = h1.get_text(strip=True) if h1 else None
 
     # =====================================
     # UPDATED DATE
     # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
+    updated_span = found["updated_span"]
     data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
 
     # =====================================
     # AUTHOR INFO
     # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
-
-    data["author"] = author_data
+    data["author"] = author_info(found["author_block"])
+    if not data["author"] and "author" in structured:
+        data["author"] = structured["author"]
 
     # =====================================
     # ALL CONTENT SECTIONS
     # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
     all_sections = []
 
-    for sec in sections:
+    for sec in found["sections"]:
         content_blocks = extract_rich_content(sec)
         if content_blocks["blocks"]:
             all_sections.append(content_blocks)
@@ -1622,377 +2179,1209 @@ def extract_center_data(driver, URLS):
     # =====================================
     # FAQ SECTION
     # =====================================
-    data["faqs"] = extract_faqs(soup)
+    if "faqs" in structured:
+        data["faqs"] = structured["faqs"]
+    else:
+        faqs = (faq_entry(q) for q in found["faq_questions"])
+        data["faqs"] = [faq for faq in faqs if faq]
 
     # =====================================
     # POLL SECTION
     # =====================================
-    data["polls"] = extract_polls(soup)
+    polls = (poll_entry(poll) for poll in found["poll_containers"])
+    data["polls"] = [poll for poll in polls if poll]
+
+    # =====================================
+    # PAGE TYPE SPECIFIC FIELDS
+    # =====================================
+    for field, extractor in extras:
+        data[field] = extractor(soup)
 
     return data
 
-def extract_news_data(driver, URLS):
-    driver.get(URLS["news"])
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+def extract_page(driver, url, page_type, soup=None):
+    spec = PAGE_TYPES[page_type]
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+    if soup is not None:
+        # Already fetched, e.g. the overview read for sub-page discovery
+        if RUN_CONFIG["incremental"]:
+            check_unchanged(url, soup)
+    elif browser_extraction_enabled(spec):
+        soup, data = fetch_page_soup_or_data(driver, url, page_type, spec)
+        if data is not None:
+            return data
+        if RUN_CONFIG["incremental"]:
+            check_unchanged(url, soup)
+    else:
+        soup = fetch_page_soup(driver, url, page_type, spec["selectors"], partial=spec["partial"])
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    return parse_exam_page(soup, spec["extras"], structured_page_data(soup.page_markup))
 
-    data = {}
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+# Like fetch_page_soup, but a page that needs Chrome is extracted (and
+# checked for changes) in the browser and comes back as data instead
+def fetch_page_soup_or_data(driver, url, page_type, spec, markup_only=False):
+    try:
+        soup = fetch_http_soup(url, spec["selectors"], spec["partial"], markup_only)
+        if soup is not None:
+            return soup, None
+        return None, fetch_browser_data(driver, url, page_type, spec["selectors"])
+    except PageMissing as e:
+        store_page(url, None, "check", missing=str(e))
+        raise
+
+
+# The two halves of extract_page for the parse pipeline: fetch workers only
+# fetch and check the page (with PageMarkup, no BeautifulSoup), and
+# extract_page_markup builds the one tree in the parse pool. Pages extracted
+# in the browser come back as data straight away.
+def fetch_page_markup(driver, url, page_type, soup=None):
+    spec = PAGE_TYPES[page_type]
+
+    if soup is not None:
+        return soup.page_markup, None
+
+    if browser_extraction_enabled(spec):
+        page, data = fetch_page_soup_or_data(driver, url, page_type, spec, markup_only=True)
+        if data is not None:
+            return None, data
+    else:
+        page = fetch_page_soup(
+            driver, url, page_type, spec["selectors"], incremental=False, markup_only=True
+        )
+
+    return page.page_markup, None
+
+
+def extract_page_markup(url, page_type, markup):
+    soup = make_page_soup(markup, PAGE_TYPES[page_type]["partial"])
+
+    if RUN_CONFIG["incremental"]:
+        try:
+            check_unchanged(url, soup)
+        except PageUnchanged as e:
+            return {"data": e.data, "unchanged": True, "state": None}
+
+    data = parse_exam_page(soup, PAGE_TYPES[page_type]["extras"], structured_page_data(markup))
+    return {"data": data, "unchanged": False, "state": PENDING_STATES.pop(url, None)}
+
+
+RICH_HEADINGS = ("h2", "h3", "h4")
+
+
+def rich_block(element, in_table):
+    name = element.name
+
+    # HEADINGS
+    if name in RICH_HEADINGS:
+        text = element.get_text(" ", strip=True)
+        if text:
+            return {"type": "heading", "value": text}
+
+    # PARAGRAPH (table cells are already in the table block)
+    elif name == "p":
+        if in_table:
+            return None
+        text = element.get_text(" ", strip=True)
+        if text:
+            return {"type": "paragraph", "value": text}
+
+    # LIST
+    elif name == "ul":
+        items = [
+            li.get_text(" ", strip=True)
+            for li in element.find_all("li", recursive=False)
+        ]
+        if items:
+            return {"type": "list", "value": items}
+
+    # TABLE
+    elif name == "table":
+        table_data = []
+        for row in element.find_all("tr"):
+            cols = [
+                c.get_text(" ", strip=True)
+                for c in row.find_all(["th", "td"])
+            ]
+            if cols:
+                table_data.append(cols)
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+        if table_data:
+            return {"type": "table", "value": table_data}
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+    # IFRAME
+    elif name == "iframe":
+        src = element.get("src") or element.get("data-original")
+        if src:
+            return {"type": "iframe", "value": src}
 
-    data["author"] = author_data
+    return None
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+def child_tags(element):
+    return [child for child in element.contents if isinstance(child, Tag)]
 
-    data["content_sections"] = all_sections
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+def extract_rich_content(container):
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    if not container:
+        return {"blocks": []}
 
-    return data
+    content = {"blocks": []}
 
-def extract_college_data(driver, URLS):
-    driver.get(URLS["college"])
+    # One depth-first walk in document order. A list or table that becomes a
+    # block already holds the text of everything inside it, so its subtree is
+    # not visited again.
+    stack = [(child, False) for child in reversed(child_tags(container))]
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+    while stack:
+        element, in_table = stack.pop()
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+        block = rich_block(element, in_table)
+        if block:
+            content["blocks"].append(block)
+            if block["type"] in ("list", "table"):
+                continue
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+        in_table = in_table or element.name == "table"
+        stack.extend((child, in_table) for child in reversed(child_tags(element)))
 
-    data = {}
+    return content
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+def faq_entry(q):
+    question = q.get_text(" ", strip=True).replace("Q:", "").strip()
+
+    answer_wrapper = q.find_parent().find_next_sibling("div")
+    if not answer_wrapper:
+        return None
+
+    answer_div = answer_wrapper.find("div", class_="facb5f")
+    if not answer_div:
+        return None
+
+    answer = answer_div.get_text(" ", strip=True).replace("A:", "").strip()
+
+    return {
+        "question": question,
+        "answer": answer
+    }
+
+
+def poll_entry(poll):
+    question_div = poll.find("div", class_="poll-question")
+    options = poll.find_all("div", class_="poll-option")
+    votes_span = poll.find("span", string=lambda x: x and "votes" in x)
+
+    if not question_div:
+        return None
+
+    return {
+        "question": question_div.get_text(strip=True),
+        "options": [
+            opt.get_text(" ", strip=True)
+            for opt in options
+        ],
+        "votes": votes_span.get_text(strip=True) if votes_span else None
+    }
+
+# ---------------- IN-BROWSER EXTRACTION ----------------
+# With --extract-in-browser, pages that need Chrome are extracted by
+# EXTRACT_SCRIPT inside the page instead of pulling page_source over the
+# wire and parsing it again here. The script mirrors parse_exam_page,
+# including BeautifulSoup's get_text(strip=True) rules, so both paths
+# return the same JSON ("python benchmarks.py browser-parity" checks it).
+# Page types with extras still take the Python path.
+EXTRACT_SCRIPT = r"""
+// Python's str.strip() whitespace, which is not quite JS's \s
+var WS = "[\\t\\n\\v\\f\\r \\x1c-\\x1f\\x85\\xa0\\u1680\\u2000-\\u200a\\u2028\\u2029\\u202f\\u205f\\u3000]";
+var STRIP = new RegExp("^" + WS + "+|" + WS + "+$", "g");
+// BeautifulSoup leaves the text of these tags out of get_text()
+var HIDDEN_TEXT = {script: 1, style: 1, template: 1, rt: 1, rp: 1};
+var FINGERPRINT_CLASSES = ["ppBox", "sectionalWrapperClass", "flx-box", "facb5f", "poll-container"];
+
+function strip(s) { return s.replace(STRIP, ""); }
+
+function hasClass(el, name) {
+    var value = el.getAttribute("class");
+    return value ? value.split(/[\t\n\f\r ]+/).indexOf(name) >= 0 : false;
+}
+
+function getText(el, sep) {
+    var parts = [];
+    (function walk(node, hidden) {
+        for (var i = 0; i < node.childNodes.length; i++) {
+            var child = node.childNodes[i];
+            if (child.nodeType === 1) {
+                walk(child, hidden || HIDDEN_TEXT[child.localName] === 1);
+            } else if (child.nodeType === 3 && !hidden) {
+                var text = strip(child.data);
+                if (text) parts.push(text);
+            }
+        }
+    })(el, false);
+    return parts.join(sep);
+}
+
+// Tag.string: the text of a tag with exactly one child, looking through
+// single-child tags
+function onlyString(el) {
+    while (el.childNodes.length === 1) {
+        var child = el.childNodes[0];
+        if (child.nodeType !== 1) return child.data;
+        el = child;
+    }
+    return null;
+}
+
+function elementChildren(el) {
+    var children = [];
+    for (var i = 0; i < el.childNodes.length; i++) {
+        if (el.childNodes[i].nodeType === 1) children.push(el.childNodes[i]);
+    }
+    return children;
+}
+
+function descendants(el, test) {
+    var found = [];
+    (function walk(node) {
+        var children = elementChildren(node);
+        for (var i = 0; i < children.length; i++) {
+            if (test(children[i])) found.push(children[i]);
+            walk(children[i]);
+        }
+    })(el);
+    return found;
+}
+
+function first(el, test) {
+    return descendants(el, test)[0] || null;
+}
+
+function named(names) {
+    return function (el) { return names.indexOf(el.localName) >= 0; };
+}
+
+function divWithClass(name) {
+    return function (el) { return el.localName === "div" && hasClass(el, name); };
+}
+
+function richBlock(el, inTable) {
+    var name = el.localName, text;
+
+    if (name === "h2" || name === "h3" || name === "h4") {
+        text = getText(el, " ");
+        if (text) return {type: "heading", value: text};
+    } else if (name === "p") {
+        if (inTable) return null;
+        text = getText(el, " ");
+        if (text) return {type: "paragraph", value: text};
+    } else if (name === "ul") {
+        var items = elementChildren(el).filter(named(["li"])).map(function (li) {
+            return getText(li, " ");
+        });
+        if (items.length) return {type: "list", value: items};
+    } else if (name === "table") {
+        var rows = [];
+        descendants(el, named(["tr"])).forEach(function (row) {
+            var cols = descendants(row, named(["th", "td"])).map(function (c) {
+                return getText(c, " ");
+            });
+            if (cols.length) rows.push(cols);
+        });
+        if (rows.length) return {type: "table", value: rows};
+    } else if (name === "iframe") {
+        var src = el.getAttribute("src") || el.getAttribute("data-original");
+        if (src) return {type: "iframe", value: src};
+    }
+    return null;
+}
+
+function richContent(container) {
+    var blocks = [];
+    var stack = elementChildren(container).reverse().map(function (c) { return [c, false]; });
+
+    while (stack.length) {
+        var item = stack.pop(), el = item[0], inTable = item[1];
+
+        var block = richBlock(el, inTable);
+        if (block) {
+            blocks.push(block);
+            if (block.type === "list" || block.type === "table") continue;
+        }
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+        inTable = inTable || el.localName === "table";
+        elementChildren(el).reverse().forEach(function (c) { stack.push([c, inTable]); });
+    }
+    return {blocks: blocks};
+}
+
+function authorInfo(box) {
+    if (!box) return {};
+
+    var link = first(box, named(["a"]));
+    var img = first(box, named(["img"]));
+    var role = first(box, function (el) { return el.localName === "p" && hasClass(el, "ePPDetail"); });
+
+    function attr(el, name) {
+        if (!el.hasAttribute(name)) throw new Error("<" + el.localName + "> without " + name);
+        return el.getAttribute(name);
+    }
+
+    return {
+        name: link ? getText(link, "") : null,
+        profile_url: link ? attr(link, "href") : null,
+        role: role ? getText(role, " ") : null,
+        image: img ? attr(img, "src") : null
+    };
+}
+
+function faqEntry(q) {
+    var question = strip(getText(q, " ").split("Q:").join(""));
+
+    var wrapper = q.parentElement ? q.parentElement.nextElementSibling : null;
+    while (wrapper && wrapper.localName !== "div") wrapper = wrapper.nextElementSibling;
+    if (!wrapper) return null;
+
+    var answer = first(wrapper, divWithClass("facb5f"));
+    if (!answer) return null;
+
+    return {question: question, answer: strip(getText(answer, " ").split("A:").join(""))};
+}
+
+function pollEntry(poll) {
+    var question = first(poll, divWithClass("poll-question"));
+    var options = descendants(poll, divWithClass("poll-option"));
+    var votes = first(poll, function (el) {
+        var s = el.localName === "span" && onlyString(el);
+        return !!s && s.indexOf("votes") >= 0;
+    });
+
+    if (!question) return null;
+
+    return {
+        question: getText(question, ""),
+        options: options.map(function (o) { return getText(o, " "); }),
+        votes: votes ? getText(votes, "") : null
+    };
+}
+
+// One pass over the document, like scan_exam_page
+var found = {
+    title: null, h1: null, updated: null, author: null,
+    sections: [], faqs: [], polls: [], fingerprint: [], structured: []
+};
+var all = descendants(document, function () { return true; });
+
+for (var i = 0; i < all.length; i++) {
+    var el = all[i], name = el.localName;
+
+    if (name === "title" && !found.title) found.title = el;
+    if (name === "h1" && !found.h1) found.h1 = el;
+    if (name === "span" && !found.updated) {
+        var s = onlyString(el);
+        if (s && s.indexOf("Updated") >= 0) found.updated = el;
+    }
+    if (name === "div") {
+        if (hasClass(el, "sectionalWrapperClass")) found.sections.push(el);
+        if (hasClass(el, "poll-container")) found.polls.push(el);
+        if (hasClass(el, "ppBox") && !found.author) found.author = el;
+    }
+    if (name === "strong" && hasClass(el, "flx-box")) found.faqs.push(el);
+    if (name === "script" && (el.getAttribute("type") || "").toLowerCase() === "application/ld+json") {
+        found.structured.push(el.textContent);
+    }
+
+    if (name === "h1" || FINGERPRINT_CLASSES.some(function (c) { return hasClass(el, c); })) {
+        found.fingerprint.push(getText(el, " "));
+    }
+}
+
+return JSON.stringify({
+    page_title: found.title ? getText(found.title, "") : null,
+    fingerprint_texts: found.fingerprint,
+    structured_texts: found.structured,
+    // For the HTML cache with --cache-browser-pages
+    markup: arguments[0] ? document.documentElement.outerHTML : null,
+    data: {
+        title: found.h1 ? getText(found.h1, "") : null,
+        updated_on: found.updated ? getText(found.updated, "") : null,
+        author: authorInfo(found.author),
+        content_sections: found.sections.map(richContent).filter(function (c) {
+            return c.blocks.length > 0;
+        }),
+        faqs: found.faqs.map(faqEntry).filter(Boolean),
+        polls: found.polls.map(pollEntry).filter(Boolean)
+    }
+});
+"""
+
+
+def browser_extraction_enabled(spec):
+    return RUN_CONFIG["browser_extract"] and not RUN_CONFIG["replay"] and not spec["extras"]
+
+
+# What the script throws is the page's fault, like a KeyError in
+# parse_exam_page, so it fails as a parse error instead of a driver one
+class ExtractScriptError(Exception):
+    pass
+
+
+def run_extract_script(driver, with_markup=False):
+    try:
+        # One JSON string instead of a nested structure keeps the wire format cheap
+        return json.loads(driver.execute_script(EXTRACT_SCRIPT, with_markup))
+    except JavascriptException as e:
+        raise ExtractScriptError(e.msg) from e
+
+
+def fetch_browser_data(driver, url, page_type=None, selectors=DETAIL_SELECTORS, incremental=True):
+    started = time.monotonic()
+    open_in_browser(driver, url, page_type, selectors)
+    # Sending the document back is what in-browser extraction avoids, so the
+    # HTML cache only gets these pages when asked for
+    with_markup = RUN_CONFIG["browser_extract_markup"] and RUN_CONFIG["html_cache"]
+    page = run_extract_script(driver, with_markup and not RUN_CONFIG["replay"])
+
+    if looks_like_not_found(page["page_title"], page["data"]["title"]):
+        raise PageMissing("not found template")
+
+    if page["markup"] is not None:
+        store_page(url, page["markup"], "browser", time.monotonic() - started)
+
+    if incremental and RUN_CONFIG["incremental"]:
+        check_page_state(
+            url, page["data"]["updated_on"], fingerprint_texts(page["fingerprint_texts"])
+        )
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+    if not RUN_CONFIG["structured_data"]:
+        return page["data"]
+    return apply_structured_data(page["data"], structured_fields(page["structured_texts"]))
+
+
+# ---------------- RETRIES ----------------
+# Timeouts and browser failures are retried with jittered exponential
+# backoff; anything else is a parse failure and retrying won't help. After
+# BREAKER_THRESHOLD consecutive failures of one page type (across exams and
+# workers) its circuit opens and the rest of the run skips that page type.
+MAX_RETRIES = 2
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 20.0
+BREAKER_THRESHOLD = 5
+
+RETRY_STATS = {
+    "retries": 0,
+    "timeouts": 0,
+    "driver_errors": 0,
+    "parse_errors": 0,
+    "breaker_skips": 0,
+}
+
+FAILURE_STATS = {
+    "timeout": "timeouts",
+    "driver": "driver_errors",
+    "parse": "parse_errors",
+}
+
+CIRCUIT_BREAKERS = None
+
+
+class CircuitBreakers:
+    def __init__(self, page_types, threshold=BREAKER_THRESHOLD):
+        self.index = {page_type: i for i, page_type in enumerate(page_types)}
+        self.threshold = threshold
+        # Consecutive failures per page type, shared with worker processes
+        self.failures = multiprocessing.Array("i", len(self.index))
+
+    def is_open(self, page_type):
+        return self.failures[self.index[page_type]] >= self.threshold
+
+    def record(self, page_type, ok):
+        with self.failures.get_lock():
+            i = self.index[page_type]
+            if ok:
+                self.failures[i] = 0
+                return
+
+            self.failures[i] += 1
+            if self.failures[i] == self.threshold:
+                print(f"⛔ {page_type} failed {self.threshold} times in a row, "
+                      f"skipping it for the rest of the run")
+
+
+def install_circuit_breakers(breakers):
+    global CIRCUIT_BREAKERS
+    CIRCUIT_BREAKERS = breakers
+
+
+def failure_kind(error):
+    if isinstance(error, TimeoutException):
+        return "timeout"
+    if isinstance(error, BROWSER_ERRORS):
+        return "driver"
+    return "parse"
+
+
+def retry_delay(attempt):
+    # Full jitter, so workers that failed together don't retry together
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+
+def call_with_retries(driver, log_name, call):
+    attempt = 0
+
+    while True:
+        try:
+            return call()
+        except (PageMissing, PageUnchanged, PageNotCached):
+            raise
+        except Exception as e:
+            kind = failure_kind(e)
+            RETRY_STATS[FAILURE_STATS[kind]] += 1
+
+            if kind == "parse" or attempt >= MAX_RETRIES or driver is None:
+                raise
 
-    data["author"] = author_data
+            # A failure outside get() can leave a dead browser behind
+            if kind == "driver" and not driver.is_responsive():
+                driver.restart(f"{log_name} {e.__class__.__name__}")
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+            delay = retry_delay(attempt)
+            print(f"{log_name} {kind} ({e.__class__.__name__}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+            RETRY_STATS["retries"] += 1
+            attempt += 1
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
 
-    data["content_sections"] = all_sections
+def print_retry_stats():
+    print(
+        f"🔂 Retries: {RETRY_STATS['retries']} (timeouts {RETRY_STATS['timeouts']}, "
+        f"driver {RETRY_STATS['driver_errors']}, parse {RETRY_STATS['parse_errors']}), "
+        f"skipped by open circuits: {RETRY_STATS['breaker_skips']}"
+    )
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+# ---------------- EXAM SCRAPER ----------------
+def page_spec(
+    suffix,
+    log_name,
+    timeout=DEFAULT_PAGE_TIMEOUT,
+    selectors=DETAIL_SELECTORS,
+    extras=(),
+    partial=True,
+):
+    return {
+        "suffix": suffix,
+        "log_name": log_name,
+        "timeout": timeout,
+        "selectors": selectors,
+        # (field, function(soup)) pairs added on top of the shared fields
+        "extras": extras,
+        # only parse PAGE_REGIONS_XPATH; turn off for extras that read elsewhere
+        "partial": partial,
+    }
+
+
+# Output key -> how to find and read that page, in the order pages are scraped
+PAGE_TYPES = {
+    "overviews": page_spec("", "overviews", timeout=20),
+    "mca": page_spec("/mca-984", "mca"),
+    "me_mtech_lateral_entry": page_spec("/me-mtech-mtech-lateral-entry-985", "me_mtech"),
+    "march": page_spec("/march-986", "march"),
+    "dates": page_spec("-dates", "dates"),
+    "ans_key": page_spec("-answer-key", "ans_key"),
+    "results": page_spec("-results", "results"),
+    "question_paper": page_spec("-question-papers", "question_paper"),
+    "pattern": page_spec("-pattern", "pattern"),
+    "cut_off": page_spec("-cutoff", "cut_off"),
+    "counselling": page_spec("-counselling", "counselling"),
+    "app_form": page_spec("-application-form", "app_form"),
+    "syllabus": page_spec("-syllabus", "syllabus"),
+    "books": page_spec("-books", "books"),
+    "preparation": page_spec("-preparation", "preparation"),
+    "admit_card": page_spec("-admit-card", "admit_card"),
+    "news": page_spec("-news", "news", timeout=8),
+    "analysis": page_spec("-analysis", "analysis"),
+    "mock_test": page_spec("-mocktest", "mock_test"),
+    "registration": page_spec("-registration", "registration"),
+    "notification": page_spec("-notification", "notification"),
+    "centre": page_spec("-centre", "centre"),
+    "college": page_spec("-college", "college", timeout=8),
+    "selection_process": page_spec("-selection-process", "selection_process"),
+}
+
+
+def build_exam_urls(base_url):
+    base_url = base_url.rstrip("/")
+
+    return {key: base_url + spec["suffix"] for key, spec in PAGE_TYPES.items()}
+
+
+# ---------------- SUB-PAGE DISCOVERY ----------------
+# Most exams only have a handful of the sub-pages above. The overview page
+# links to every one that exists, so it is parsed once per exam and the set
+# of pages is cached for DISCOVERY_TTL.
+EXAM_PAGES_CACHE = os.path.join(CACHE_DIR, "exam_pages.json")
+DISCOVERY_TTL = 7 * 24 * 3600
+
+
+def discover_exam_pages(soup, base_url):
+    base_url = base_url.rstrip("/")
+    keys_by_suffix = {spec["suffix"]: key for key, spec in PAGE_TYPES.items()}
+    found = {"overviews"}
+
+    for link in soup.find_all("a", href=True):
+        url = urljoin(BASE, link["href"]).split("#")[0].split("?")[0].rstrip("/")
+        if not url.startswith(base_url):
+            continue
 
-    return data
+        key = keys_by_suffix.get(url[len(base_url):])
+        if key:
+            found.add(key)
 
-def extract_mca_data(driver, URLS):
-    driver.get(URLS["mca"])
+    return found
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+# Returns the page types to scrape and, when the overview had to be fetched
+# for that, its soup so it is extracted from the same fetch
+def known_exam_pages(driver, base_url):
+    base_url = base_url.rstrip("/")
+    cached = load_json(EXAM_PAGES_CACHE, {}).get(base_url)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    if cached and time.time() - cached["discovered_at"] < DISCOVERY_TTL:
+        return set(cached["pages"]), None
 
-    data = {}
+    try:
+        soup = fetch_page_soup(driver, base_url, "overviews", incremental=False)
+    except Exception as e:
+        print(f"Sub-page discovery failed for {base_url}:", e)
+        return set(PAGE_TYPES), None
+
+    pages = discover_exam_pages(soup, base_url)
+
+    # No tab links at all means the nav markup moved, not that there are no pages
+    if pages == {"overviews"}:
+        print(f"No sub-page links found on {base_url}, trying every page type")
+        return set(PAGE_TYPES), soup
+
+    update_json(EXAM_PAGES_CACHE, {
+        base_url: {"pages": sorted(pages), "discovered_at": time.time()}
+    })
+
+    return pages, soup
+
+
+def scrape_exam(driver, exam, page_sink=None):
+    print(f"Processing: {exam['exam_short_name']}")
+
+    exam_data = exam.copy()
+    URLS = build_exam_urls(exam["base_url"])
+    pages, overview_soup = known_exam_pages(driver, exam["base_url"])
+    missing = load_negative_cache()
+    newly_missing = {}
+    extracted = []
+
+    def safe_scrape(key):
+        url = URLS[key]
+        log_name = PAGE_TYPES[key]["log_name"]
+
+        if url in missing and not RUN_CONFIG["replay"]:
+            NEGATIVE_CACHE_STATS["skipped"] += 1
+            NEGATIVE_CACHE_STATS["seconds_saved"] += missing[url]["cost"]
+            return None
+
+        if CIRCUIT_BREAKERS is not None and CIRCUIT_BREAKERS.is_open(key):
+            RETRY_STATS["breaker_skips"] += 1
+            return None
+
+        soup = overview_soup if key == "overviews" else None
+
+        started = time.monotonic()
+        try:
+            if page_sink is None:
+                data = call_with_retries(
+                    driver, log_name, lambda: extract_page(driver, url, key, soup)
+                )
+            else:
+                markup, data = call_with_retries(
+                    driver, log_name, lambda: fetch_page_markup(driver, url, key, soup)
+                )
+                if markup is not None:
+                    # Filled in once the parse pool has extracted it
+                    page_sink(key, url, markup)
+            extracted.append(url)
+            if CIRCUIT_BREAKERS is not None:
+                CIRCUIT_BREAKERS.record(key, True)
+            return data
+        except PageUnchanged as e:
+            return e.data
+        except PageMissing as e:
+            print(f"{log_name} page missing: {e}")
+            newly_missing[url] = {
+                "page_type": key,
+                "reason": str(e),
+                "checked_at": time.time(),
+                "cost": round(time.monotonic() - started, 2),
+            }
+            return None
+        except PageNotCached as e:
+            # A gap in the --replay cache says nothing about the page type
+            print(f"{log_name} page skipped: {e}")
+            return None
+        except Exception as e:
+            print(f"{log_name} page error:", e)
+            if CIRCUIT_BREAKERS is not None:
+                CIRCUIT_BREAKERS.record(key, False)
+            return None
+
+    for key in PAGE_TYPES:
+        exam_data[key] = safe_scrape(key) if key in pages else None
+
+    if not RUN_CONFIG["replay"]:
+        record_missing_pages(newly_missing)
+
+    if RUN_CONFIG["incremental"]:
+        commit_page_states(extracted)
+        PENDING_STATES.clear()
+
+    return exam_data
+
+
+# ---------------- WORKER POOL ----------------
+# Each worker owns one Chrome and pulls (index, exam) tasks from a shared
+# queue. Results carry the listing index so the parent can put them back in
+# listing order no matter which worker finished first.
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Per-process counters, summed into the parent's copy when a worker exits
+RUN_STATS = {
+    "network": NETWORK_STATS,
+    "negative_cache": NEGATIVE_CACHE_STATS,
+    "incremental": INCREMENTAL_STATS,
+    "retries": RETRY_STATS,
+    "apis": API_STATS,
+}
+WORKER_JOIN_TIMEOUT = 30
+
+
+def exam_worker(
+    task_queue,
+    result_queue,
+    driver_kwargs=None,
+    config=None,
+    limiter=None,
+    breakers=None,
+    pipeline=False,
+):
+    RUN_CONFIG.update(config or {})
+    install_rate_limiter(limiter)
+    install_circuit_breakers(breakers)
+
+    # Own process group, so chromedriver and Chrome can be killed with us
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+
+    driver = None
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+    try:
+        if not RUN_CONFIG["replay"]:
+            driver = ManagedDriver(**(driver_kwargs or {}))
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+            index, exam = task
+            result_queue.put(("start", index, os.getpid()))
 
-    data["author"] = author_data
+            page_sink = None
+            if pipeline:
+                def page_sink(key, url, markup, index=index):
+                    # Blocks while the parse pool is behind
+                    result_queue.put(("page", index, key, url, markup))
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+            try:
+                exam_data = scrape_exam(driver, exam, page_sink)
+            except Exception as e:
+                print(f"{exam['exam_short_name']} worker error:", e)
+                exam_data = None
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+            result_queue.put(("done", index, exam_data))
 
-    data["content_sections"] = all_sections
+        result_queue.put(("stats", RUN_STATS))
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+    finally:
+        if driver is not None:
+            driver.quit()
+
+
+# ---------------- PARSE PIPELINE ----------------
+# With --parse-workers, fetch workers only drive Chrome and HTTP and send the
+# page markup back on the (bounded) result queue. The parent hands each page
+# to a process pool for extraction and puts exam_data together once every
+# page of an exam is back, so browsers never wait on BeautifulSoup.
+DEFAULT_PARSE_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+QUEUED_PAGES_PER_WORKER = 4
+PENDING_PARSES_PER_WORKER = 2
+
+PARSING = object()
+
+
+def configure_parse_worker(config):
+    RUN_CONFIG.update(config)
+
+
+class ParsePipeline:
+    def __init__(self, workers, on_exam):
+        self.executor = ProcessPoolExecutor(
+            workers, initializer=configure_parse_worker, initargs=(dict(RUN_CONFIG),)
+        )
+        self.max_pending = workers * PENDING_PARSES_PER_WORKER
+        self.on_exam = on_exam
+
+        self.futures = {}  # future -> (index, page type, url)
+        self.pages = collections.defaultdict(dict)  # index -> {page type: result}
+        self.fetched = {}  # index -> exam_data from the fetch worker
+
+    def submit(self, index, key, url, markup):
+        future = self.executor.submit(extract_page_markup, url, key, markup)
+        self.futures[future] = (index, key, url)
+        self.pages[index][key] = (url, PARSING)
+
+    def exam_fetched(self, index, exam_data):
+        self.fetched[index] = exam_data
+        self.finish(index)
+
+    def collect(self, timeout=0):
+        if not self.futures:
+            return
+
+        done, _ = wait(self.futures, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            index, key, url = self.futures.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"error": e}
+            self.pages[index][key] = (url, result)
+            self.finish(index)
+
+    def wait_for_room(self):
+        # Stop reading the result queue while the pool is full, so fetch
+        # workers block on put() instead of markup piling up in memory
+        while len(self.futures) >= self.max_pending:
+            self.collect(timeout=1)
+
+    def drain(self):
+        while self.futures:
+            self.collect(timeout=1)
+
+    def finish(self, index):
+        if index not in self.fetched:
+            return
+        if any(result is PARSING for _, result in self.pages[index].values()):
+            return
+
+        exam_data = self.fetched.pop(index)
+        results = self.pages.pop(index, {})
+        if exam_data is None:
+            self.on_exam(index, None)
+            return
+
+        states = {}
+        for key, (url, result) in results.items():
+            log_name = PAGE_TYPES[key]["log_name"]
+
+            if "error" in result:
+                print(f"{log_name} page error:", result["error"])
+                RETRY_STATS["parse_errors"] += 1
+                if CIRCUIT_BREAKERS is not None:
+                    CIRCUIT_BREAKERS.record(key, False)
+                continue
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+            exam_data[key] = result["data"]
 
-    return data
-def extract_me_lateral_entry_data(driver, URLS):
-    driver.get(URLS["me-mtech-mtech-lateral-entry-985"])
+            if result["unchanged"]:
+                INCREMENTAL_STATS["unchanged"] += 1
+            elif result["state"] is not None:
+                INCREMENTAL_STATS["changed"] += 1
+                states[url] = result["state"]
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+        if states:
+            PENDING_STATES.update(states)
+            commit_page_states(list(states))
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+        self.on_exam(index, exam_data)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    def shutdown(self):
+        self.executor.shutdown(cancel_futures=True)
 
-    data = {}
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
+def kill_worker_group(process):
+    if process.pid is None or not hasattr(os, "killpg"):
+        return
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def scrape_exams_parallel(
+    exams,
+    workers=DEFAULT_WORKERS,
+    driver_kwargs=None,
+    on_result=None,
+    parse_workers=0,
+):
+    task_queue = multiprocessing.Queue()
+    if parse_workers:
+        result_queue = multiprocessing.Queue(workers * QUEUED_PAGES_PER_WORKER)
+    else:
+        result_queue = multiprocessing.Queue()
+
+    for task in enumerate(exams):
+        task_queue.put(task)
+    for _ in range(workers):
+        task_queue.put(None)
+
+    processes = [
+        multiprocessing.Process(
+            target=exam_worker,
+            args=(
+                task_queue,
+                result_queue,
+                driver_kwargs,
+                dict(RUN_CONFIG),
+                RATE_LIMITER,
+                CIRCUIT_BREAKERS,
+                bool(parse_workers),
+            ),
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    results = {}
+    in_flight = {}
+
+    def finish(index, exam_data):
+        results[index] = exam_data
+        if exam_data is not None and on_result:
+            on_result(index, exam_data)
+
+    # Started after the fetch workers so they don't inherit the pool
+    pipeline = ParsePipeline(parse_workers, finish) if parse_workers else None
+
+    def handle(message):
+        nonlocal in_flight
+
+        if message[0] == "start":
+            _, index, pid = message
+            in_flight[pid] = index
+        elif message[0] == "stats":
+            merge_counters(RUN_STATS, message[1])
+        elif message[0] == "page":
+            _, index, key, url, markup = message
+            pipeline.submit(index, key, url, markup)
+        else:
+            _, index, exam_data = message
+            in_flight = {pid: i for pid, i in in_flight.items() if i != index}
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
+            if pipeline:
+                pipeline.exam_fetched(index, exam_data)
+            else:
+                finish(index, exam_data)
 
-    data["author"] = author_data
+    try:
+        while len(results) < len(exams):
+            if pipeline:
+                pipeline.wait_for_room()
+                pipeline.collect()
+
+            try:
+                handle(result_queue.get(timeout=1))
+            except queue.Empty:
+                for process in processes:
+                    if process.is_alive() or process.pid not in in_flight:
+                        continue
+
+                    index = in_flight.pop(process.pid)
+                    print(f"Worker {process.pid} died while scraping "
+                          f"{exams[index]['exam_short_name']} (exit code {process.exitcode})")
+                    results[index] = None
+                    kill_worker_group(process)
+
+                if not any(process.is_alive() for process in processes):
+                    if pipeline:
+                        pipeline.drain()
+                    break
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
+    finally:
+        # Workers send their stats on the way out, keep reading until they exit
+        deadline = time.monotonic() + WORKER_JOIN_TIMEOUT
+        while any(p.is_alive() for p in processes) and time.monotonic() < deadline:
+            try:
+                handle(result_queue.get(timeout=0.5))
+            except queue.Empty:
+                pass
+
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+            kill_worker_group(process)
+
+        while True:
+            try:
+                handle(result_queue.get_nowait())
+            except queue.Empty:
+                break
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+        if pipeline:
+            pipeline.drain()
+            pipeline.shutdown()
+
+    merged = []
+    for index, exam in enumerate(exams):
+        exam_data = results.get(index)
+        if exam_data is None:
+            print(f"⚠️ {exam['exam_short_name']} was not scraped, keeping listing data only")
+            exam_data = exam.copy()
+        merged.append(exam_data)
+
+    return merged
+
+
+# ---------------- CHECKPOINTING ----------------
+# Every finished exam is appended to a JSONL journal next to the output file,
+# fsynced every --fsync-every exams. --resume skips exams already in it, and
+# the journal is removed once the final file has been written with every
+# exam finished.
+class ExamJournal:
+    def __init__(self, path, fsync_every=1, resume=False):
+        self.path = path
+        self.fsync_every = max(1, fsync_every)
+        self.records = self.load() if resume else {}
+        self.unsynced = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def load(self):
+        records = {}
+        try:
+            with open(self.path, "r+b") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn line from the crash we're resuming after
+                    records[record["exam_id"]] = record
 
-    data["content_sections"] = all_sections
+                # Cut a torn last line, or the next append would be glued onto it
+                f.seek(0)
+                end = f.read().rfind(b"\n") + 1
+                f.truncate(end)
+        except OSError:
+            pass
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+        return records
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    def append(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+        self.records[record["exam_id"]] = record
 
-    return data
-def extract_cat_MArch_data(driver, URLS):
-    driver.get(URLS["march-986"])
+        self.unsynced += 1
+        if self.unsynced >= self.fsync_every:
+            os.fsync(self.file.fileno())
+            self.unsynced = 0
 
-    # Wait until page loads
-    WebDriverWait(driver, 20).until(
-        EC.presence_of_element_located((By.TAG_NAME, "h1"))
-    )
+    def close(self):
+        if self.file.closed:
+            return
+        if self.unsynced:
+            os.fsync(self.file.fileno())
+        self.file.close()
 
-    # Scroll to bottom (for lazy loading content)
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
+    def remove(self):
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
 
-    data = {}
+def journal_path_for(output):
+    return f"{output}.journal.jsonl"
 
-    # =====================================
-    # TITLE
-    # =====================================
-    h1 = soup.find("h1")
-    data["title"] = h1.get_text(strip=True) if h1 else None
 
-    # =====================================
-    # UPDATED DATE
-    # =====================================
-    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
-    data["updated_on"] = updated_span.get_text(strip=True) if updated_span else None
+# ---------------- SHARDING ----------------
+# exam_id is derived from the canonical exam URL, so it is the same whichever
+# pages or machine a run covers. --shard i/N keeps the exams whose id is i
+# mod N and --merge stitches the partial files back together in listing order.
+def exam_id_for(url):
+    host, path, _ = canonical_url(url)
+    digest = hashlib.sha1(f"{host}{path}".encode("utf-8")).hexdigest()
+    # 48 bits stays exact in JavaScript numbers
+    return int(digest[:12], 16)
 
-    # =====================================
-    # AUTHOR INFO
-    # =====================================
-    author_data = {}
-    author_block = soup.find("div", class_="ppBox")
-
-    if author_block:
-        author_link = author_block.find("a")
-        img = author_block.find("img")
-        role = author_block.find("p", class_="ePPDetail")
-
-        author_data = {
-            "name": author_link.get_text(strip=True) if author_link else None,
-            "profile_url": author_link["href"] if author_link else None,
-            "role": role.get_text(" ", strip=True) if role else None,
-            "image": img["src"] if img else None
-        }
 
-    data["author"] = author_data
+def in_shard(exam_id, shard_index, shard_count):
+    return exam_id % shard_count == shard_index
 
-    # =====================================
-    # ALL CONTENT SECTIONS
-    # =====================================
-    sections = soup.find_all("div", class_="sectionalWrapperClass")
-    all_sections = []
 
-    for sec in sections:
-        content_blocks = extract_rich_content(sec)
-        if content_blocks["blocks"]:
-            all_sections.append(content_blocks)
+def shard_output_path(output, shard_index, shard_count):
+    root, ext = os.path.splitext(output)
+    return f"{root}.shard-{shard_index}-of-{shard_count}{ext or '.json'}"
 
-    data["content_sections"] = all_sections
 
-    # =====================================
-    # FAQ SECTION
-    # =====================================
-    data["faqs"] = extract_faqs(soup)
+def final_records(records, keep_index=False):
+    records = sorted(records, key=lambda r: (r["listing_index"], r["exam_id"]))
+    if keep_index:
+        return records
 
-    # =====================================
-    # POLL SECTION
-    # =====================================
-    data["polls"] = extract_polls(soup)
+    return [
+        {"exam_id": record["exam_id"], "exam_data": record["exam_data"]}
+        for record in records
+    ]
+
+
+def merge_shard_files(paths, output):
+    records = {}
+    shard_counts = set()
+    shards_seen = set()
+
+    for path in paths:
+        partial = load_json(path)
+        if not partial or "exams" not in partial:
+            raise SystemExit(f"{path} is not a shard file")
+
+        shard_index, shard_count = partial["shard"]
+        shard_counts.add(shard_count)
+        shards_seen.add(shard_index)
+
+        for record in partial["exams"]:
+            records[record["exam_id"]] = record
+
+    if len(shard_counts) > 1:
+        raise SystemExit(f"Shard files come from different splits: {sorted(shard_counts)}")
+
+    shard_count = shard_counts.pop()
+    missing = sorted(set(range(shard_count)) - shards_seen)
+    if missing:
+        print(f"⚠️ Missing shard(s) {missing} of {shard_count}, their exams won't be in {output}")
+
+    write_json_atomic(output, final_records(records.values()), indent=4, ensure_ascii=False)
+    print(f"✅ Merged {len(records)} exams from {len(paths)} shard files into {output}")
 
-    return data
 
 # ---------------- MAIN ----------------
 # if __name__ == "__main__":
@@ -2188,94 +3577,308 @@ def extract_cat_MArch_data(driver, URLS):
 #         driver.quit()
 
 
-if __name__ == "__main__":
-    driver = create_driver()
-    counter = 75
+def shard_spec(value):
+    index, _, count = value.partition("/")
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got {value!r}")
 
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"invalid shard {value!r}")
+    return index, count
+
+
+def page_range(value):
+    first, _, last = value.partition("-")
     try:
-        final_data = []
+        first = int(first)
+        last = int(last) if last else None
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FIRST-LAST, got {value!r}")
 
-        for page in range(5, 9):
-            print(f"Scraping listing page {page}")
+    if first < 1 or (last is not None and last < first):
+        raise argparse.ArgumentTypeError(f"invalid page range {value!r}")
+    return first, last
 
-            exams = scrape_listing_page(driver, page)
-            if not exams:
-                break
 
-            for exam in exams:
-                print(f"Processing: {exam['exam_short_name']}")
-
-                exam_data = exam.copy()  # ✅ define first
-
-                base_url = exam["base_url"].rstrip("/")
-
-                URLS = {
-                    "overviews": base_url,
-                    "dates": base_url + "-dates",
-                    "ans_key": base_url + "-answer-key",
-                    "results": base_url + "-results",
-                    "question_paper": base_url + "-question-papers",
-                    "pattern": base_url + "-pattern",
-                    "cut_off": base_url + "-cutoff",
-                    "counselling": base_url + "-counselling",
-                    "app_form": base_url + "-application-form",
-                    "syllabus": base_url + "-syllabus",
-                    "books": base_url + "-books",
-                    "preparation": base_url + "-preparation",
-                    "admit_card": base_url + "-admit-card",
-                    "news": base_url + "-news",
-                    "analysis": base_url + "-analysis",
-                    "mock_test": base_url + "-mocktest",
-                    "registration": base_url + "-registration",
-                    "college": base_url + "-college",
-                    "centre": base_url + "-centre",
-                    "notification": base_url + "-notification",
-                    "mca": base_url + "/mca-984",
-                    "me_mtech_lateral_entry": base_url + "/me-mtech-mtech-lateral-entry-985",
-                    "march": base_url + "/march-986",
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape shiksha.com MBA exams")
+    parser.add_argument(
+        "--output", default="complete_exam_data.json",
+        help="where to write the scraped exams (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--pages", type=page_range, default=(1, None), metavar="FIRST-LAST",
+        help="only scrape this slice of the listing, e.g. 5-8 (default: every page)"
+    )
+    parser.add_argument(
+        "--shard", type=shard_spec, metavar="i/N",
+        help="only scrape exams whose id falls in shard i of N (0-based) "
+             "and write a partial file next to --output"
+    )
+    parser.add_argument(
+        "--merge", nargs="+", metavar="SHARD_FILE",
+        help="combine partial shard files into --output instead of scraping"
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="skip exams already in the checkpoint journal of an interrupted run"
+    )
+    parser.add_argument(
+        "--fsync-every", type=int, default=1, metavar="N",
+        help="fsync the checkpoint journal every N finished exams (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--discover-apis", action="store_true",
+        help=f"record the JSON endpoints behind lazy-loaded content into {API_MANIFEST} and exit"
+    )
+    parser.add_argument(
+        "--no-apis", action="store_true",
+        help=f"don't call the endpoints in {API_MANIFEST} for lazy-loaded content"
+    )
+    parser.add_argument(
+        "--no-structured-data", action="store_true",
+        help="ignore JSON-LD and read the author and FAQs from the page markup only"
+    )
+    parser.add_argument(
+        "--replay", action="store_true",
+        help="run the extractors against the HTML cache, without a browser"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="reuse the previous output for pages whose content hasn't changed"
+    )
+    parser.add_argument(
+        "--no-html-cache", action="store_true",
+        help="don't store fetched pages in the HTML cache"
+    )
+    parser.add_argument(
+        "--parser", choices=HTML_PARSERS, default=RUN_CONFIG["parser"],
+        help="BeautifulSoup backend for parsing pages (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--full-parse", action="store_true",
+        help="build the whole page instead of only the regions the extractors read"
+    )
+    parser.add_argument(
+        "--extract-in-browser", action="store_true",
+        help="extract pages that need Chrome with a script inside the page "
+             "instead of parsing page_source; those pages stay out of the HTML cache "
+             "(and --replay) unless --cache-browser-pages is given"
+    )
+    parser.add_argument(
+        "--cache-browser-pages", action="store_true",
+        help="with --extract-in-browser, also send each page's HTML back for the "
+             "HTML cache (costs the transfer --extract-in-browser saves)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS,
+        help="number of parallel Chrome worker processes (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--parse-workers", type=int, default=DEFAULT_PARSE_WORKERS,
+        help="with --workers > 1, extract pages in this many separate processes "
+             "while the browsers keep fetching, 0 to extract in the fetch "
+             "workers (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--block-types", default=",".join(BLOCKED_RESOURCE_TYPES),
+        help="comma separated resource types Chrome should not fetch, one of "
+             f"{', '.join(RESOURCE_TYPE_PATTERNS)} (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--block-domain", action="append", default=[], metavar="DOMAIN",
+        help="extra domain to block, can be given more than once"
+    )
+    parser.add_argument(
+        "--no-block", action="store_true",
+        help="let Chrome load every resource"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=RATE_LIMIT_INITIAL,
+        help="starting request rate per second across all workers (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--max-rate", type=float, default=RATE_LIMIT_MAX,
+        help="never go above this many requests per second (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--no-rate-limit", action="store_true",
+        help="fetch as fast as the workers can go"
+    )
+    parser.add_argument(
+        "--breaker-threshold", type=int, default=BREAKER_THRESHOLD,
+        help="skip a page type for the rest of the run after this many "
+             "consecutive failures (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--max-pages-per-driver", type=int, default=MAX_PAGES_PER_DRIVER,
+        help="restart Chrome after this many navigations (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--max-renderer-mb", type=int, default=MAX_RENDERER_RSS_MB,
+        help="restart Chrome once its renderers use more memory (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--nav-timeout", type=int, default=NAV_TIMEOUT,
+        help="seconds before a navigation is abandoned (default: %(default)s)"
+    )
+    return parser.parse_args(argv)
+
+
+def driver_kwargs_from_args(args):
+    limits = {
+        "max_pages": args.max_pages_per_driver,
+        "max_rss_mb": args.max_renderer_mb,
+        "nav_timeout": args.nav_timeout,
+    }
+
+    if args.no_block:
+        return {"block_types": (), "block_domains": (), **limits}
+
+    block_types = tuple(t.strip() for t in args.block_types.split(",") if t.strip())
+    unknown = [t for t in block_types if t not in RESOURCE_TYPE_PATTERNS]
+    if unknown:
+        raise SystemExit(f"Unknown resource type(s): {', '.join(unknown)}")
+
+    return {
+        "block_types": block_types,
+        "block_domains": BLOCKED_DOMAINS + tuple(args.block_domain),
+        **limits,
+    }
+
+
+def run_crawl(args):
+    RUN_CONFIG["replay"] = args.replay
+    RUN_CONFIG["html_cache"] = not args.no_html_cache
+    RUN_CONFIG["incremental"] = args.incremental and not args.replay
+    RUN_CONFIG["previous_output"] = args.output
+    RUN_CONFIG["parser"] = args.parser
+    RUN_CONFIG["partial_parse"] = not args.full_parse
+    RUN_CONFIG["browser_extract"] = args.extract_in_browser
+    RUN_CONFIG["browser_extract_markup"] = args.cache_browser_pages
+    RUN_CONFIG["apis"] = not args.no_apis
+    RUN_CONFIG["structured_data"] = not args.no_structured_data
+    html_parser()  # settle the fallback here so workers inherit it
+
+    if not args.no_rate_limit:
+        install_rate_limiter(RateLimiter(args.rate, args.max_rate))
+    install_circuit_breakers(CircuitBreakers(PAGE_TYPES, args.breaker_threshold))
+
+    driver_kwargs = driver_kwargs_from_args(args)
+    driver = None if args.replay else ManagedDriver(**driver_kwargs)
+
+    try:
+        first_page, last_page = args.pages
+        exams = scrape_all_listing_pages(driver, first_page, last_page)
+
+        # (listing index, exam id, exam) for the exams this run is responsible for
+        tasks = [
+            (index, exam_id_for(exam["base_url"]), exam)
+            for index, exam in enumerate(exams)
+        ]
+        if args.shard:
+            shard_index, shard_count = args.shard
+            tasks = [task for task in tasks if in_shard(task[1], shard_index, shard_count)]
+            print(f"Shard {shard_index}/{shard_count}: {len(tasks)} of {len(exams)} exams")
+
+        if args.shard:
+            output = shard_output_path(args.output, *args.shard)
+        else:
+            output = args.output
+
+        journal = ExamJournal(journal_path_for(output), args.fsync_every, args.resume)
+        if journal.records:
+            print(f"Resuming: {len(journal.records)} exams already done")
+
+        pending = [task for task in tasks if task[1] not in journal.records]
+
+        def on_result(position, exam_data):
+            index, exam_id, _ = pending[position]
+            journal.append({
+                "listing_index": index,
+                "exam_id": exam_id,
+                "exam_data": exam_data,
+            })
+
+        pending_exams = [exam for _, _, exam in pending]
+
+        try:
+            if args.workers > 1:
+                # Workers start their own browsers, no need to keep this one around
+                if driver is not None:
+                    driver.quit()
+                    driver = None
+                scraped = scrape_exams_parallel(
+                    pending_exams, args.workers, driver_kwargs, on_result, args.parse_workers
+                )
+            else:
+                scraped = []
+                for position, exam in enumerate(pending_exams):
+                    exam_data = scrape_exam(driver, exam)
+                    on_result(position, exam_data)
+                    scraped.append(exam_data)
+        finally:
+            journal.close()
+
+        # Exams that never finished keep their listing data, but stay out
+        # of the journal so a --resume retries them
+        records = dict(journal.records)
+        for (index, exam_id, _), exam_data in zip(pending, scraped):
+            if exam_id not in records:
+                records[exam_id] = {
+                    "listing_index": index,
+                    "exam_id": exam_id,
+                    "exam_data": exam_data,
                 }
+        records = list(records.values())
+
+        if args.shard:
+            write_json_atomic(output, {
+                "shard": list(args.shard),
+                "exams": final_records(records, keep_index=True),
+            }, indent=4, ensure_ascii=False)
+        else:
+            write_json_atomic(output, final_records(records), indent=4, ensure_ascii=False)
+
+        # Keep the journal while anything failed, so --resume can finish the run
+        unfinished = [exam_id for _, exam_id, _ in pending if exam_id not in journal.records]
+        if unfinished:
+            print(f"⚠️ {len(unfinished)} exams didn't finish, run again with --resume to retry them")
+        else:
+            journal.remove()
+
+        print(f"✅ All data from all pages saved to {output}")
+        print_network_stats()
+        print_negative_cache_stats()
+        if RUN_CONFIG["incremental"]:
+            print_incremental_stats()
+        print_retry_stats()
+        if load_api_endpoints():
+            print_api_stats()
+        if RATE_LIMITER is not None:
+            print(f"🚦 Rate limiter settled at {RATE_LIMITER.describe()}")
+
+    finally:
+        if driver is not None:
+            driver.quit()
 
-                def safe_scrape(key, func):
-                    try:
-                        return func(driver, URLS)
-                    except Exception as e:
-                        print(f"{key} page error:", e)
-                        return None
-
-                exam_data["overviews"] = safe_scrape("overviews", extract_cat_exam_data)
-                exam_data["mca"] = safe_scrape("mca", extract_mca_data)
-                exam_data["me_mtech_lateral_entry"] = safe_scrape("me_mtech", extract_me_lateral_entry_data)
-                exam_data["march"] = safe_scrape("march", extract_cat_MArch_data)
-                exam_data["dates"] = safe_scrape("dates", extract_dates_data)
-                exam_data["ans_key"] = safe_scrape("ans_key", extract_answerkey_data)
-                exam_data["results"] = safe_scrape("results", extract_result_data)
-                exam_data["question_paper"] = safe_scrape("question_paper", extract_question_paper_data)
-                exam_data["pattern"] = safe_scrape("pattern", extract_pattern_data)
-                exam_data["cut_off"] = safe_scrape("cut_off", extract_cut_off_data)
-                exam_data["counselling"] = safe_scrape("counselling", extract_Counselling_data)
-                exam_data["app_form"] = safe_scrape("app_form", extract_app_form_data)
-                exam_data["syllabus"] = safe_scrape("syllabus", extract_syllabus_data)
-                exam_data["books"] = safe_scrape("books", extract_books_data)
-                exam_data["preparation"] = safe_scrape("preparation", extract_preparation_data)
-                exam_data["admit_card"] = safe_scrape("admit_card", extract_admit_card_data)
-                exam_data["news"] = safe_scrape("news", extract_news_data)
-                exam_data["analysis"] = safe_scrape("analysis", extract_Analysis_data)
-                exam_data["mock_test"] = safe_scrape("mock_test", extract_mock_test_data)
-                exam_data["registration"] = safe_scrape("registration", extract_registration_data)
-                exam_data["notification"] = safe_scrape("notification", extract_notification_data)
-                exam_data["centre"] = safe_scrape("centre", extract_center_data)
-                exam_data["college"] = safe_scrape("college", extract_college_data)
-
-                final_data.append({
-                    "exam_id": counter,
-                    "exam_data": exam_data
-                })
-                counter += 1
-
-        with open("complete_exam_data.json", "w", encoding="utf-8") as f:
-            json.dump(final_data, f, indent=4, ensure_ascii=False)
-
-        print("✅ All data from all pages saved successfully!")
 
+def run_api_discovery(args):
+    driver = ManagedDriver(**driver_kwargs_from_args(args))
+    try:
+        discover_apis(driver)
     finally:
         driver.quit()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.merge:
+        merge_shard_files(args.merge, args.output)
+    elif args.discover_apis:
+        run_api_discovery(args)
+    else:
+        run_crawl(args)
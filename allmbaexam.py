@@ -5,11 +5,10 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
 import time
 import json
-from webdriver_manager.chrome import ChromeDriverManager
 from urllib.parse import urljoin
+from allexam import resolve_chrome_binaries, make_soup, date_entry
 
 
 url = "https://www.shiksha.com/mba/exams-pc-101"
@@ -30,10 +29,11 @@ def create_driver():
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
 
-    # Remove this line if running on Windows
-    # options.binary_location = "/usr/bin/chromium"
+    browser, chromedriver = resolve_chrome_binaries()
+    if browser:
+        options.binary_location = browser
 
-    service = Service(ChromeDriverManager().install())
+    service = Service(chromedriver)
 
     driver = webdriver.Chrome(service=service, options=options)
     return driver
@@ -56,7 +56,7 @@ def scrape_exam_from_url(driver, url):
 
     scroll_to_bottom(driver)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    soup = make_soup(driver.page_source)
 
     results = []
 
@@ -95,10 +95,10 @@ def scrape_exam_from_url(driver, url):
             event_col = row.select_one(".fix-textlength p")
 
             if date_col and event_col:
-                result["important_dates"].append({
-                    "date": " ".join(date_col.get_text().split()),
-                    "event": event_col.get_text(strip=True)
-                })
+                result["important_dates"].append(date_entry(
+                    " ".join(date_col.get_text().split()),
+                    event_col.get_text(strip=True)
+                ))
 
         results.append(result)
 
@@ -0,0 +1,634 @@
+import os
+import sys
+import time
+import json
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+import tracemalloc
+
+from bs4 import Comment, Doctype, Tag
+
+from allexam import (
+    BASE,
+    EXTRACT_SCRIPT,
+    HTML_PARSERS,
+    LISTING_URL,
+    RUN_CONFIG,
+    cached_page_html,
+    content_fingerprint,
+    create_driver,
+    exam_id_for,
+    fingerprint_texts,
+    author_info,
+    extract_rich_content,
+    faq_entry,
+    has_required_content,
+    listing_page_url,
+    load_html_index,
+    make_page_soup,
+    make_soup,
+    parse_exam_page,
+    parse_date_range,
+    parse_listing_soup,
+    parser_available,
+    partial_parse_enabled,
+    poll_entry,
+    run_extract_script,
+    structured_page_data,
+)
+
+
+# Checks and timings that run against the HTML cache (.scraper_cache/html).
+# Without a crawl cache they fall back to the saved pages in fixtures/;
+# for real coverage fill the cache with a normal crawl first:
+#
+#   python allexam.py --pages 1-1
+#   python benchmarks.py parser-parity
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+# ---------------- CACHED PAGES ----------------
+def fixture_url(kind, name):
+    # fixtures/exam/cat-exam.html -> /mba/cat-exam, fixtures/listing/page-2.html -> ?pageNo=2
+    if kind == "listing":
+        return listing_page_url(int(name.rsplit("-", 1)[1]))
+    return f"{BASE}/mba/{name}"
+
+
+def fixture_pages(limit=None):
+    pages = []
+
+    for kind in ("exam", "listing"):
+        folder = os.path.join(FIXTURES_DIR, kind)
+        for filename in sorted(os.listdir(folder)):
+            name, ext = os.path.splitext(filename)
+            if ext != ".html":
+                continue
+            with open(os.path.join(folder, filename), "rb") as f:
+                pages.append((fixture_url(kind, name), f.read()))
+
+    return pages[:limit] if limit else pages
+
+
+def cached_pages(limit=None):
+    pages = []
+
+    for url, entry in load_html_index().items():
+        if entry["sha256"] is None or entry["missing"]:
+            continue
+        pages.append((url, cached_page_html(url)))
+
+        if limit and len(pages) >= limit:
+            break
+
+    if not pages:
+        pages = fixture_pages(limit)
+        if not pages:
+            raise SystemExit("❌ The HTML cache is empty and there are no fixtures, run a crawl first")
+        print(f"ℹ️ The HTML cache is empty, using {len(pages)} pages from {FIXTURES_DIR}")
+    return pages
+
+
+def is_listing_url(url):
+    return url.startswith(LISTING_URL)
+
+
+def extract_cached(url, soup):
+    if is_listing_url(url):
+        return parse_listing_soup(soup)
+    return parse_exam_page(soup)
+
+
+def as_json(data):
+    return json.dumps(data, ensure_ascii=False, sort_keys=True)
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        result = func(*args)
+        return result, time.perf_counter() - started, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def report_mismatches(name, mismatches, total):
+    if mismatches:
+        print(f"❌ {name}: {len(mismatches)} of {total} pages differ")
+        for url in mismatches[:20]:
+            print("   ", url)
+        return False
+
+    print(f"✅ {name}: all {total} pages identical")
+    return True
+
+
+# ---------------- PARSER PARITY ----------------
+def parser_parity(args):
+    parsers = [p for p in HTML_PARSERS if parser_available(p)]
+    if len(parsers) < 2:
+        raise SystemExit(f"❌ Need at least two parsers installed, have {parsers}")
+
+    pages = cached_pages(args.limit)
+    timings = {parser: 0.0 for parser in parsers}
+    mismatches = []
+
+    for url, html in pages:
+        outputs = {}
+        for parser in parsers:
+            started = time.perf_counter()
+            outputs[parser] = as_json(extract_cached(url, make_soup(html, parser)))
+            timings[parser] += time.perf_counter() - started
+
+        if len(set(outputs.values())) > 1:
+            mismatches.append(url)
+
+    for parser, elapsed in timings.items():
+        print(f"⏱️ {parser}: {elapsed * 1000 / len(pages):.1f} ms/page")
+
+    return report_mismatches("parser parity", mismatches, len(pages))
+
+
+# ---------------- PARTIAL PARSE ----------------
+# Everything the scraper reads from a detail page, so the partial tree is
+# checked for the not-found test and fingerprint as well as the extraction
+def page_reading(soup):
+    h1 = soup.find("h1")
+    return {
+        "title_tag": soup.title.get_text(strip=True) if soup.title else None,
+        "h1": h1.get_text(strip=True) if h1 else None,
+        "has_required_content": has_required_content(soup),
+        "fingerprint": content_fingerprint(soup),
+        "data": parse_exam_page(soup),
+    }
+
+
+def partial_parse(args):
+    RUN_CONFIG["parser"] = "lxml"
+    if not partial_parse_enabled():
+        raise SystemExit("❌ Partial parsing needs lxml installed")
+
+    pages = [(url, html) for url, html in cached_pages(args.limit) if not is_listing_url(url)]
+    totals = {"full": [0.0, 0], "partial": [0.0, 0]}
+    mismatches = []
+
+    for url, html in pages:
+        outputs = {}
+        for mode in totals:
+            soup, elapsed, peak = measure(make_page_soup, html, mode == "partial")
+            outputs[mode] = as_json(page_reading(soup))
+            totals[mode][0] += elapsed
+            totals[mode][1] = max(totals[mode][1], peak)
+
+        if outputs["full"] != outputs["partial"]:
+            mismatches.append(url)
+
+    for mode, (elapsed, peak) in totals.items():
+        print(
+            f"⏱️ {mode}: {elapsed * 1000 / len(pages):.1f} ms/page, "
+            f"peak {peak / 1024 / 1024:.1f} MB"
+        )
+
+    return report_mismatches("partial parse", mismatches, len(pages))
+
+
+# ---------------- RICH CONTENT ----------------
+# extract_rich_content before it became a single walk: find_all over the
+# whole section plus find_parent("table") per paragraph, and lists/paragraphs
+# nested in lists and tables were emitted a second time
+def extract_rich_content_find_all(container):
+    if not container:
+        return {"blocks": []}
+
+    content = {"blocks": []}
+
+    elements = container.find_all(
+        ["h2", "h3", "h4", "p", "ul", "table", "iframe"],
+        recursive=True
+    )
+
+    for element in elements:
+        if element.name in ["h2", "h3", "h4"]:
+            text = element.get_text(" ", strip=True)
+            if text:
+                content["blocks"].append({"type": "heading", "value": text})
+
+        elif element.name == "p":
+            if element.find_parent("table"):
+                continue
+            text = element.get_text(" ", strip=True)
+            if text:
+                content["blocks"].append({"type": "paragraph", "value": text})
+
+        elif element.name == "ul":
+            items = [
+                li.get_text(" ", strip=True)
+                for li in element.find_all("li", recursive=False)
+            ]
+            if items:
+                content["blocks"].append({"type": "list", "value": items})
+
+        elif element.name == "table":
+            table_data = []
+            for row in element.find_all("tr"):
+                cols = [c.get_text(" ", strip=True) for c in row.find_all(["th", "td"])]
+                if cols:
+                    table_data.append(cols)
+            if table_data:
+                content["blocks"].append({"type": "table", "value": table_data})
+
+        elif element.name == "iframe":
+            src = element.get("src") or element.get("data-original")
+            if src:
+                content["blocks"].append({"type": "iframe", "value": src})
+
+    return content
+
+
+def rich_content(args):
+    pages = [(url, html) for url, html in cached_pages() if not is_listing_url(url)]
+    pages.sort(key=lambda page: len(page[1]), reverse=True)
+    pages = pages[:args.limit or 20]
+
+    timings = {"find_all": 0.0, "single walk": 0.0}
+    blocks = {"find_all": 0, "single walk": 0}
+
+    for _, html in pages:
+        sections = make_soup(html).find_all("div", class_="sectionalWrapperClass")
+
+        for name, extract in (
+            ("find_all", extract_rich_content_find_all),
+            ("single walk", extract_rich_content),
+        ):
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                for section in sections:
+                    result = extract(section)
+                    blocks[name] += len(result["blocks"])
+            timings[name] += time.perf_counter() - started
+
+    runs = len(pages) * args.repeat
+    for name, elapsed in timings.items():
+        print(
+            f"⏱️ {name}: {elapsed * 1000 / runs:.2f} ms/page, "
+            f"{blocks[name] // args.repeat} blocks"
+        )
+    print(
+        f"🚀 {timings['find_all'] / timings['single walk']:.1f}x faster on the "
+        f"{len(pages)} largest cached pages, "
+        f"{(blocks['find_all'] - blocks['single walk']) // args.repeat} duplicate blocks dropped"
+    )
+
+
+# ---------------- FUSED EXTRACTOR ----------------
+# parse_exam_page before the fields were collected in one pass: a separate
+# find/find_all over the whole document for every field
+def parse_exam_page_multipass(soup):
+    h1 = soup.find("h1")
+    updated_span = soup.find("span", string=lambda x: x and "Updated" in x)
+
+    sections = []
+    for sec in soup.find_all("div", class_="sectionalWrapperClass"):
+        content_blocks = extract_rich_content(sec)
+        if content_blocks["blocks"]:
+            sections.append(content_blocks)
+
+    faqs = [faq_entry(q) for q in soup.find_all("strong", class_="flx-box")]
+    polls = [poll_entry(poll) for poll in soup.find_all("div", class_="poll-container")]
+
+    return {
+        "title": h1.get_text(strip=True) if h1 else None,
+        "updated_on": updated_span.get_text(strip=True) if updated_span else None,
+        "author": author_info(soup.find("div", class_="ppBox")),
+        "content_sections": sections,
+        "faqs": [faq for faq in faqs if faq],
+        "polls": [poll for poll in polls if poll],
+    }
+
+
+def fused_extractor(args):
+    pages = [(url, html) for url, html in cached_pages(args.limit) if not is_listing_url(url)]
+    timings = {"multi-pass": 0.0, "fused": 0.0}
+    mismatches = []
+
+    for url, html in pages:
+        # Both the full tree and the partial one must agree
+        for partial in (False, True):
+            soup = make_page_soup(html, partial)
+            outputs = {}
+
+            for name, extract in (
+                ("multi-pass", parse_exam_page_multipass),
+                ("fused", parse_exam_page),
+            ):
+                started = time.perf_counter()
+                for _ in range(args.repeat):
+                    outputs[name] = as_json(extract(soup))
+                timings[name] += time.perf_counter() - started
+
+            if outputs["multi-pass"] != outputs["fused"] and url not in mismatches:
+                mismatches.append(url)
+
+    runs = len(pages) * 2 * args.repeat
+    for name, elapsed in timings.items():
+        print(f"⏱️ {name}: {elapsed * 1000 / runs:.2f} ms/page")
+
+    return report_mismatches("fused extractor", mismatches, len(pages))
+
+
+# ---------------- BROWSER PARITY ----------------
+# Loads each cached page into Chrome with the page's own scripts disabled and
+# compares EXTRACT_SCRIPT with the Python path over the same DOM, i.e. what
+# parse_exam_page sees after pulling page_source.
+def browser_parity(args):
+    pages = [(url, html) for url, html in cached_pages(args.limit) if not is_listing_url(url)]
+    driver = create_driver()
+    driver.execute_cdp_cmd("Emulation.setScriptExecutionDisabled", {"value": True})
+
+    timings = {"page_source + parse": 0.0, "in-browser": 0.0}
+    mismatches = []
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "page.html")
+
+            for url, html in pages:
+                with open(path, "wb") as f:
+                    f.write(html)
+                driver.get("file://" + path)
+
+                started = time.perf_counter()
+                soup = make_soup(driver.page_source)
+                expected = {
+                    "page_title": soup.title.get_text(strip=True) if soup.title else None,
+                    "fingerprint": content_fingerprint(soup),
+                    "data": parse_exam_page(soup),
+                }
+                timings["page_source + parse"] += time.perf_counter() - started
+
+                started = time.perf_counter()
+                page = run_extract_script(driver)
+                timings["in-browser"] += time.perf_counter() - started
+
+                actual = {
+                    "page_title": page["page_title"],
+                    "fingerprint": fingerprint_texts(page["fingerprint_texts"]),
+                    "data": page["data"],
+                }
+                if as_json(expected) != as_json(actual):
+                    mismatches.append(url)
+    finally:
+        driver.quit()
+
+    for name, elapsed in timings.items():
+        print(f"⏱️ {name}: {elapsed * 1000 / len(pages):.1f} ms/page")
+
+    return report_mismatches("browser parity", mismatches, len(pages))
+
+
+# ---------------- SCRIPT PARITY ----------------
+# browser-parity without Chrome: EXTRACT_SCRIPT runs under node against a
+# minimal DOM (just what the script touches) built from the same BeautifulSoup
+# tree parse_exam_page reads, so the two extractors see identical input.
+NODE_DOM_HARNESS = r"""
+const input = JSON.parse(require("fs").readFileSync(0, "utf8"));
+
+function build(n, parent) {
+    const node = {
+        nodeType: n.t, localName: n.name || null, data: n.data, attrs: n.attrs || {},
+        childNodes: [], parentElement: parent && parent.nodeType === 1 ? parent : null,
+    };
+    node.getAttribute = (k) => (k in node.attrs ? node.attrs[k] : null);
+    node.hasAttribute = (k) => k in node.attrs;
+    Object.defineProperty(node, "textContent", {get() {
+        return node.childNodes.map((c) => c.nodeType === 1 ? c.textContent : c.nodeType === 3 ? c.data : "").join("");
+    }});
+    for (const c of n.children || []) node.childNodes.push(build(c, node));
+    return node;
+}
+
+const document = build(input.tree, null);
+(function link(n) {
+    const els = n.childNodes.filter((c) => c.nodeType === 1);
+    els.forEach((e, i) => { e.nextElementSibling = els[i + 1] || null; link(e); });
+})(document);
+
+const run = new Function("document", "return (function () {" + input.script + "}).apply(null, [false]);");
+process.stdout.write(run(document));
+"""
+
+
+def dom_tree(node):
+    if isinstance(node, Tag):
+        attrs = {k: " ".join(v) if isinstance(v, list) else v for k, v in node.attrs.items()}
+        return {"t": 1, "name": node.name, "attrs": attrs, "children": [dom_tree(c) for c in node.contents]}
+    if isinstance(node, Doctype):
+        return {"t": 10, "data": str(node)}
+    if isinstance(node, Comment):
+        return {"t": 8, "data": str(node)}
+    return {"t": 3, "data": str(node)}
+
+
+def script_parity(args):
+    node = shutil.which("node")
+    if node is None:
+        raise SystemExit("❌ script-parity needs node on the PATH")
+
+    pages = [(url, html) for url, html in cached_pages(args.limit) if not is_listing_url(url)]
+    mismatches = []
+
+    for url, html in pages:
+        soup = make_soup(html)
+        try:
+            expected = as_json({
+                "page_title": soup.title.get_text(strip=True) if soup.title else None,
+                "fingerprint": content_fingerprint(soup),
+                "data": parse_exam_page(soup),
+            })
+        except KeyError:
+            expected = "error"  # e.g. an author link without href; the script throws too
+
+        tree = {"t": 9, "children": [dom_tree(c) for c in soup.contents]}
+        result = subprocess.run(
+            [node, "-e", NODE_DOM_HARNESS],
+            input=json.dumps({"script": EXTRACT_SCRIPT, "tree": tree}),
+            capture_output=True, text=True,
+        )
+
+        if result.returncode != 0:
+            actual = "error"
+        else:
+            page = json.loads(result.stdout)
+            actual = as_json({
+                "page_title": page["page_title"],
+                "fingerprint": fingerprint_texts(page["fingerprint_texts"]),
+                "data": page["data"],
+            })
+
+        if expected != actual:
+            mismatches.append(url)
+
+    return report_mismatches("script parity", mismatches, len(pages))
+
+
+# ---------------- STRUCTURED DATA ----------------
+# How many cached pages carry JSON-LD for each field, how long the raw scan
+# takes next to the DOM path, and where the two disagree. Differences are
+# printed, not failed on: the author is only taken from JSON-LD when the page
+# has none, and then the URL is absolute where the page's would be relative.
+def structured_data(args):
+    RUN_CONFIG["structured_data"] = True
+    pages = [(url, html) for url, html in cached_pages(args.limit) if not is_listing_url(url)]
+    timings = {"JSON-LD scan": 0.0, "DOM": 0.0}
+    covered = {"author": 0, "faqs": 0}
+    differences = {field: [] for field in covered}
+
+    for url, html in pages:
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            structured = structured_page_data(html)
+        timings["JSON-LD scan"] += time.perf_counter() - started
+
+        soup = make_page_soup(html, partial_parse_enabled())
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            dom = parse_exam_page(soup)
+        timings["DOM"] += time.perf_counter() - started
+
+        for field, value in structured.items():
+            covered[field] += 1
+            if as_json(value) != as_json(dom[field]):
+                differences[field].append(url)
+
+    runs = len(pages) * args.repeat
+    for name, elapsed in timings.items():
+        print(f"⏱️ {name}: {elapsed * 1000 / runs:.2f} ms/page")
+
+    for field, count in covered.items():
+        print(f"📦 {field}: JSON-LD on {count} of {len(pages)} pages, {len(differences[field])} differ from the DOM")
+        for url in differences[field][:5]:
+            print("   ", url)
+
+
+# ---------------- DATE PARSER ----------------
+DATE_CASES = {
+    "15 Nov '25 - 20 Nov '25": ("2025-11-15", "2025-11-20", "confirmed"),
+    "28 - 30 Jan '26": ("2026-01-28", "2026-01-30", "confirmed"),
+    "20 Dec - 5 Jan '26": ("2025-12-20", "2026-01-05", "confirmed"),
+    "20 Dec '25 - 5 Jan": ("2025-12-20", "2026-01-05", "confirmed"),
+    "1st September 2025 - 3rd Sept 2025": ("2025-09-01", "2025-09-03", "confirmed"),
+    "Mayor '25": (None, None, None),
+    "Marks": (None, None, None),
+    "5th Jan '26 to 9th Jan '26": ("2026-01-05", "2026-01-09", "confirmed"),
+    "Feb '26": ("2026-02-01", "2026-02-28", "confirmed"),
+    "30 Nov 2025": ("2025-11-30", "2025-11-30", "confirmed"),
+    "15 Nov '25 (Tentative)": ("2025-11-15", "2025-11-15", "tentative"),
+    "31 Feb '26": (None, None, None),
+    "To be announced": (None, None, None),
+}
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+# Listing-like text: a couple of thousand distinct dates, repeated the way
+# the same deadlines show up on every card of a listing crawl
+def synthetic_dates(count, distinct=2000):
+    rng = random.Random(42)
+    pool = []
+
+    while len(pool) < distinct:
+        month, day, year = rng.choice(MONTH_NAMES), rng.randint(1, 28), rng.choice([25, 26])
+        shape = rng.randrange(5)
+
+        if shape == 0:
+            text = f"{day} {month} '{year}"
+        elif shape == 1:
+            text = f"{day} {month} '{year} - {min(day + rng.randint(1, 5), 28)} {month} '{year}"
+        elif shape == 2:
+            text = f"{day} - {min(day + rng.randint(1, 5), 28)} {month} '{year}"
+        elif shape == 3:
+            text = f"{month} '{year}"
+        else:
+            text = f"{day} {month} '{year} (Tentative)"
+        pool.append(text)
+
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def date_parser(args):
+    wrong = [text for text, expected in DATE_CASES.items() if parse_date_range(text) != expected]
+    for text in wrong:
+        print(f"❌ {text!r}: {parse_date_range(text)}, expected {DATE_CASES[text]}")
+
+    texts = synthetic_dates(args.limit or 100_000)
+    timings = {"uncached": parse_date_range.__wrapped__, "memoized": parse_date_range}
+
+    for name, parse in timings.items():
+        parse_date_range.cache_clear()
+        started = time.perf_counter()
+        unparsed = sum(parse(text)[0] is None for text in texts)
+        timings[name] = time.perf_counter() - started
+        print(f"⏱️ {name}: {timings[name]:.2f} s for {len(texts)} dates, {unparsed} unparsed")
+
+    print(f"🚀 memoized {timings['uncached'] / timings['memoized']:.1f}x faster, {parse_date_range.cache_info()}")
+    return not wrong
+
+
+# ---------------- EXAM IDS ----------------
+# Journals, shards and merged output are keyed by these, so they must not
+# change between versions (values from before canonical_url kept ?pageNo=)
+EXAM_ID_CASES = {
+    "https://www.shiksha.com/mba/cat-exam": 26403235439479,
+    "https://shiksha.com/mba/xat-exam/": 153501179473233,
+    "https://www.shiksha.com/mba/exams/snap": 105776407209693,
+    "https://www.shiksha.com/mba/exams/snap?pageNo=2": 105776407209693,
+}
+
+
+def exam_ids(args):
+    wrong = [url for url, expected in EXAM_ID_CASES.items() if exam_id_for(url) != expected]
+    for url in wrong:
+        print(f"❌ {url}: {exam_id_for(url)}, expected {EXAM_ID_CASES[url]}")
+
+    if not wrong:
+        print(f"✅ exam ids: all {len(EXAM_ID_CASES)} stable")
+    return not wrong
+
+
+# ---------------- MAIN ----------------
+COMMANDS = {
+    "parser-parity": parser_parity,
+    "partial-parse": partial_parse,
+    "rich-content": rich_content,
+    "fused-extractor": fused_extractor,
+    "browser-parity": browser_parity,
+    "script-parity": script_parity,
+    "structured-data": structured_data,
+    "date-parser": date_parser,
+    "exam-ids": exam_ids,
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Parity checks and timings over the HTML cache")
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument(
+        "--limit", type=int, metavar="N",
+        help="only use the first N cached pages (rich-content: the N largest, default 20; "
+             "date-parser: N synthetic dates, default 100000)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5,
+        help="timing repetitions per page (default: %(default)s)"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    ok = COMMANDS[args.command](args)
+    sys.exit(0 if ok is not False else 1)